@@ -70,7 +70,7 @@ def sign(message, private_key, output):
         return
     
     signature = bls.sign_message(message.encode(), private_key_bytes)
-    serialized = bls.serialize_signature(signature)
+    serialized = bls.serialize_signature_str(signature)
     
     if output:
         with open(output, 'w') as f:
@@ -98,7 +98,7 @@ def verify(signature, public_key, message):
             public_key = f.read().strip()
     
     try:
-        sig_obj = bls.deserialize_signature(signature_data)
+        sig_obj = bls.deserialize_signature_str(signature_data)
         sig_obj.message = message.encode()
         sig_obj.public_key = bytes.fromhex(public_key)
         
@@ -157,7 +157,7 @@ def generate_test_data(count, output_dir):
     # Save signatures
     signatures_file = output_path / 'signatures.json'
     with open(signatures_file, 'w') as f:
-        json.dump([bls.serialize_signature(sig) for sig in test_data], f, indent=2)
+        json.dump([bls.serialize_signature_str(sig) for sig in test_data], f, indent=2)
     
     # Save public keys
     public_keys_file = output_path / 'public_keys.txt'
@@ -184,7 +184,7 @@ def batch_verify(signatures_file):
         with open(signatures_file, 'r') as f:
             signatures_data = json.load(f)
         
-        signatures = [bls.deserialize_signature(sig_data) for sig_data in signatures_data]
+        signatures = [bls.deserialize_signature_str(sig_data) for sig_data in signatures_data]
         results = bls.batch_verify(signatures)
         
         click.echo(f"Total signatures: {results['total_signatures']}")
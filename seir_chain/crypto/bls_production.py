@@ -5,11 +5,134 @@ Enhanced version with proper private key generation and validation.
 """
 
 from py_ecc.bls import G2ProofOfPossession as bls_pop
-from typing import List, Tuple, Dict, Any
+from py_ecc.bls.g2_primitives import (
+    G1_to_pubkey, G2_to_signature, is_inf, pubkey_to_G1, signature_to_G2, subgroup_check
+)
+from py_ecc.bls.hash_to_curve import hash_to_G2
+from py_ecc.fields import optimized_bls12_381_FQ12 as FQ12
+from py_ecc.optimized_bls12_381 import G1, Z1, Z2, add, double, final_exponentiate, multiply, neg, pairing
+from eth_utils import ValidationError
+from typing import List, Tuple, Dict, Any, Optional
+from concurrent.futures import ProcessPoolExecutor
+import atexit
 import os
 import json
+import base64
+import struct
 import hashlib
 from dataclasses import dataclass
+from functools import lru_cache
+
+# Batches up to this size are verified one signature at a time; larger ones
+# are first checked with a single random linear combination
+SMALL_BATCH_LIMIT = 4
+
+# Parallel batches are cut into about this many slices per worker, so a
+# slice whose combined check fails (and falls back to one-by-one checks)
+# does not leave the other workers idle
+SLICES_PER_WORKER = 4
+
+# Wire header of a serialized signature: timestamp, then the lengths of the
+# signature, public key and message bytes that follow it
+_SIGNATURE_HEADER = struct.Struct("<QHHI")
+
+# Number of validated public key points kept by _load_pubkey
+PUBKEY_CACHE_SIZE = 4096
+
+@lru_cache(maxsize=PUBKEY_CACHE_SIZE)
+def _load_pubkey(public_key: bytes):
+    """
+    Decompress a public key and run KeyValidate on it (not infinity, in the
+    G1 subgroup). Cached, so repeated keys skip the subgroup check.
+    
+    Returns:
+        The G1 point, or None if the key is invalid
+    """
+    if len(public_key) != 48:
+        return None
+    try:
+        point = pubkey_to_G1(public_key)
+    except (ValidationError, ValueError, AssertionError):
+        return None
+    if is_inf(point) or not subgroup_check(point):
+        return None
+    return point
+
+# Number of hashed message points kept by _hash_message
+MESSAGE_POINT_CACHE_SIZE = 1024
+
+@lru_cache(maxsize=MESSAGE_POINT_CACHE_SIZE)
+def _hash_message(message: bytes, dst: bytes = bls_pop.DST):
+    """
+    hash_to_G2 with the proof-of-possession ciphersuite DST (or dst, e.g.
+    POP_TAG for possession proofs). Cached, so a message signed by many
+    keys (committee votes) is hashed once.
+    """
+    return hash_to_G2(message, dst, bls_pop.xmd_hash_function)
+
+# Fixed-base table for deriving public keys: _g1_windows()[j][d] = d * 16^j * G1
+_G1_WINDOW_BITS = 4
+_g1_window_table: Optional[List[List[Any]]] = None
+
+def _g1_windows() -> List[List[Any]]:
+    """Build the fixed-base table on first use (~1k point additions)."""
+    global _g1_window_table
+    if _g1_window_table is None:
+        table = []
+        base = G1
+        for _ in range(-(-255 // _G1_WINDOW_BITS)):
+            row = [Z1, base]
+            for _ in range(2, 1 << _G1_WINDOW_BITS):
+                row.append(add(row[-1], base))
+            table.append(row)
+            for _ in range(_G1_WINDOW_BITS):
+                base = double(base)
+        _g1_window_table = table
+    return _g1_window_table
+
+def _sk_to_pk(secret_key_int: int) -> bytes:
+    """
+    Same result as bls_pop.SkToPk, but multiplies G1 with the fixed-base
+    table: one addition per non-zero 4-bit window instead of a full
+    double-and-add.
+    """
+    table = _g1_windows()
+    window_mask = (1 << _G1_WINDOW_BITS) - 1
+    point = Z1
+    j = 0
+    while secret_key_int:
+        digit = secret_key_int & window_mask
+        if digit:
+            point = add(point, table[j][digit])
+        secret_key_int >>= _G1_WINDOW_BITS
+        j += 1
+    return G1_to_pubkey(point)
+
+# Worker pool for batch_verify, created on the first parallel batch, and
+# its worker count
+_verify_pool: Optional[ProcessPoolExecutor] = None
+_verify_pool_workers = 0
+
+def _get_verify_pool(workers: int) -> ProcessPoolExecutor:
+    """The shared pool, replaced by a larger one if more workers are requested."""
+    global _verify_pool, _verify_pool_workers
+    if _verify_pool is None or _verify_pool_workers < workers:
+        _shutdown_verify_pool()
+        _verify_pool = ProcessPoolExecutor(max_workers=workers)
+        _verify_pool_workers = workers
+    return _verify_pool
+
+@atexit.register
+def _shutdown_verify_pool() -> None:
+    global _verify_pool, _verify_pool_workers
+    if _verify_pool is not None:
+        _verify_pool.shutdown()
+        _verify_pool = None
+        _verify_pool_workers = 0
+
+def _verify_slice_in_worker(signatures: List["BLSSignature"]) -> Tuple[int, List[int]]:
+    """Pool entry point: verify one slice with the module-level instance."""
+    return production_bls._verify_slice(signatures)
 
 @dataclass
 class BLSKeyPair:
@@ -34,6 +157,11 @@ class ProductionBLS:
     def __init__(self):
         # BLS12-381 curve order
         self.curve_order = 0x73EDA753299D7D483339D80809A1D80553BDA402FFFE5BFEFFFFFFFF00000001
+        # Fixed slice size for parallel batch_verify; None picks one per batch
+        self.batch_slice_size: Optional[int] = None
+        # Committee aggregate key and negated member keys, see set_committee
+        self._committee_apk = None
+        self._committee_neg: Dict[bytes, Any] = {}
         
     def generate_key_pair(self, key_id: str = "") -> BLSKeyPair:
         """
@@ -56,9 +184,36 @@ class ProductionBLS:
                 break
         
         secret_key = secret_key_int.to_bytes(32, 'big')
-        public_key = bls_pop.SkToPk(secret_key_int)
+        public_key = _sk_to_pk(secret_key_int)
         return BLSKeyPair(secret_key=secret_key, public_key=public_key, key_id=key_id)
     
+    def generate_key_pairs(self, count: int, key_id_prefix: str = "") -> List[BLSKeyPair]:
+        """
+        Generate many BLS key pairs, drawing the randomness in one call.
+        
+        Args:
+            count: Number of key pairs to generate
+            key_id_prefix: If given, key pair i gets key_id f"{key_id_prefix}{i}"
+            
+        Returns:
+            List of BLSKeyPair objects
+        """
+        random_bytes = os.urandom(32 * count)
+        key_pairs = []
+        for i in range(count):
+            secret_key_int = int.from_bytes(random_bytes[32 * i:32 * i + 32], 'big') % self.curve_order
+            key_id = f"{key_id_prefix}{i}" if key_id_prefix else ""
+            if secret_key_int == 0:
+                # Not a valid key; draw this one again
+                key_pairs.append(self.generate_key_pair(key_id))
+                continue
+            key_pairs.append(BLSKeyPair(
+                secret_key=secret_key_int.to_bytes(32, 'big'),
+                public_key=_sk_to_pk(secret_key_int),
+                key_id=key_id
+            ))
+        return key_pairs
+    
     def sign_message(self, message: bytes, secret_key: bytes) -> BLSSignature:
         """
         Sign a message with enhanced error handling and metadata.
@@ -76,8 +231,10 @@ class ProductionBLS:
             raise ValueError("Secret key must be 32 bytes")
             
         secret_key_int = int.from_bytes(secret_key, 'big')
-        signature = bls_pop.Sign(secret_key_int, message)
-        public_key = bls_pop.SkToPk(secret_key_int)
+        if not 0 < secret_key_int < self.curve_order:
+            raise ValidationError("Invalid secret key")
+        signature = G2_to_signature(multiply(_hash_message(message), secret_key_int))
+        public_key = _sk_to_pk(secret_key_int)
         
         return BLSSignature(
             signature=signature,
@@ -97,17 +254,156 @@ class ProductionBLS:
             bool: True if signature is valid
         """
         try:
-            return bls_pop.Verify(signature.public_key, signature.message, signature.signature)
+            pubkey_point = _load_pubkey(signature.public_key)
+            return pubkey_point is not None and self._check_pairing(
+                pubkey_point, signature.message, signature.signature
+            )
         except Exception as e:
             print(f"Signature verification failed: {e}")
             return False
     
-    def batch_verify(self, signatures: List[BLSSignature]) -> Dict[str, Any]:
+    def _check_pairing(self, pubkey_point, message: bytes, signature: bytes,
+                       dst: bytes = bls_pop.DST) -> bool:
+        """
+        Core verification against an already validated public key point:
+        e(sig, G1) * e(H(m), -pk) == 1, as in py_ecc's Verify.
+        """
+        if not isinstance(message, bytes) or not isinstance(signature, bytes) or len(signature) != 96:
+            return False
+        try:
+            signature_point = signature_to_G2(signature)
+            if not subgroup_check(signature_point):
+                return False
+            message_point = _hash_message(message, dst)
+            return final_exponentiate(
+                pairing(signature_point, G1, final_exponentiate=False)
+                * pairing(message_point, neg(pubkey_point), final_exponentiate=False)
+            ) == FQ12.one()
+        except (ValidationError, ValueError, AssertionError):
+            return False
+    
+    def _verify_combined(self, signatures: List[BLSSignature]) -> bool:
+        """
+        Check a whole batch with one final exponentiation.
+        
+        With random 64-bit scalars r_i (r_0 = 1) the batch is valid iff
+        e(sum r_i*sig_i, -G1) * prod e(H(m_i), r_i*pk_i) == 1. An invalid
+        signature slips through with probability about 2^-64. Public keys and
+        signatures get the same validity and subgroup checks as Verify.
+        
+        Signatures sharing a public key are coalesced into one pairing
+        e(sum r_i*H(m_i), pk), saving a Miller loop per repeated key.
+        
+        Args:
+            signatures: List of BLSSignature objects to verify
+            
+        Returns:
+            bool: True if every signature in the batch is valid
+        """
+        scalars = os.urandom(8 * len(signatures))
+        combined_signature = Z2
+        # public key bytes -> (pubkey point, [(r_i, H(m_i)), ...])
+        terms_by_key: Dict[bytes, Tuple[Any, List[Tuple[int, Any]]]] = {}
+        try:
+            for i, sig in enumerate(signatures):
+                scalar = 1 if i == 0 else int.from_bytes(scalars[8 * i:8 * i + 8], 'big') or 1
+                
+                pubkey_point = _load_pubkey(sig.public_key)
+                if pubkey_point is None:
+                    return False
+                signature_point = signature_to_G2(sig.signature)
+                if not subgroup_check(signature_point):
+                    return False
+                
+                combined_signature = add(combined_signature, multiply(signature_point, scalar))
+                message_point = _hash_message(sig.message)
+                terms_by_key.setdefault(sig.public_key, (pubkey_point, []))[1].append(
+                    (scalar, message_point)
+                )
+            
+            product = pairing(combined_signature, neg(G1), final_exponentiate=False)
+            for pubkey_point, terms in terms_by_key.values():
+                if len(terms) == 1:
+                    # Scaling in G1 is cheaper than in G2
+                    scalar, message_point = terms[0]
+                    product *= pairing(message_point, multiply(pubkey_point, scalar),
+                                       final_exponentiate=False)
+                    continue
+                combined_message = Z2
+                for scalar, message_point in terms:
+                    combined_message = add(combined_message, multiply(message_point, scalar))
+                product *= pairing(combined_message, pubkey_point, final_exponentiate=False)
+            return final_exponentiate(product) == FQ12.one()
+        except (ValidationError, ValueError, AssertionError, TypeError):
+            return False
+    
+    def _verify_slice(self, signatures: List[BLSSignature]) -> Tuple[int, List[int]]:
+        """
+        Verify a slice of signatures serially.
+        
+        Args:
+            signatures: List of BLSSignature objects to verify
+            
+        Returns:
+            Tuple of (valid count, indices of invalid signatures in the slice)
+        """
+        if len(signatures) > SMALL_BATCH_LIMIT and self._verify_combined(signatures):
+            return len(signatures), []
+        
+        # Small slice, or the combined check failed: find the invalid ones
+        invalid_indices = self._locate_invalid(signatures)
+        return len(signatures) - len(invalid_indices), invalid_indices
+    
+    def _locate_invalid(self, signatures: List[BLSSignature]) -> List[int]:
+        """
+        Find the invalid signatures in a slice by bisection.
+        
+        Each half gets a combined check and only failing halves are split
+        further, so k bad signatures cost O(k log N) combined checks instead
+        of N single verifications. A valid batch always passes the combined
+        check, so if the left half passes the right half must hold a bad
+        signature and its check is skipped.
+        
+        Args:
+            signatures: List of BLSSignature objects to search
+            
+        Returns:
+            List of indices of invalid signatures in the slice
+        """
+        if len(signatures) <= SMALL_BATCH_LIMIT:
+            return [i for i, sig in enumerate(signatures) if not self.verify_signature(sig)]
+        
+        middle = len(signatures) // 2
+        left, right = signatures[:middle], signatures[middle:]
+        left_valid = len(left) > SMALL_BATCH_LIMIT and self._verify_combined(left)
+        invalid_indices = [] if left_valid else self._locate_invalid(left)
+        if left_valid or len(right) <= SMALL_BATCH_LIMIT or not self._verify_combined(right):
+            invalid_indices.extend(middle + i for i in self._locate_invalid(right))
+        return invalid_indices
+    
+    def _slice_size(self, count: int, workers: int) -> int:
+        """
+        Slice size for a parallel batch: batch_slice_size if set, otherwise
+        about SLICES_PER_WORKER slices per worker, each still large enough to
+        take the combined check.
+        """
+        if self.batch_slice_size:
+            return self.batch_slice_size
+        return max(SMALL_BATCH_LIMIT + 1, -(-count // (workers * SLICES_PER_WORKER)))
+    
+    def batch_verify(self, signatures: List[BLSSignature],
+                     workers: int = 1) -> Dict[str, Any]:
         """
         Batch verify multiple signatures for performance optimization.
         
+        Batches larger than SMALL_BATCH_LIMIT are checked with a random
+        linear combination. With workers > 1 they are first split into
+        slices that a shared process pool verifies in parallel.
+        
         Args:
             signatures: List of BLSSignature objects to verify
+            workers: Number of worker processes; 1 (the default) verifies
+                in-process, and os.cpu_count() is a typical opt-in value
             
         Returns:
             Dict with verification results and performance metrics
@@ -123,12 +419,19 @@ class ProductionBLS:
         import time
         start_time = time.time()
         
-        for i, sig in enumerate(signatures):
-            if self.verify_signature(sig):
-                results["valid_signatures"] += 1
-            else:
-                results["invalid_signatures"] += 1
-                results["invalid_indices"].append(i)
+        if workers > 1 and len(signatures) > SMALL_BATCH_LIMIT:
+            chunk_size = self._slice_size(len(signatures), workers)
+            offsets = range(0, len(signatures), chunk_size)
+            chunks = [signatures[offset:offset + chunk_size] for offset in offsets]
+            outcomes = _get_verify_pool(workers).map(_verify_slice_in_worker, chunks)
+        else:
+            offsets = [0]
+            outcomes = [self._verify_slice(signatures)]
+        
+        for offset, (valid, invalid_indices) in zip(offsets, outcomes):
+            results["valid_signatures"] += valid
+            results["invalid_indices"].extend(offset + i for i in invalid_indices)
+        results["invalid_signatures"] = len(results["invalid_indices"])
         
         end_time = time.time()
         results["verification_time_ms"] = (end_time - start_time) * 1000
@@ -155,6 +458,74 @@ class ProductionBLS:
         
         return bls_pop.Aggregate(signatures)
     
+    def pop_prove(self, secret_key: bytes) -> bytes:
+        """
+        Prove possession of a secret key by signing its own public key
+        under the POP_TAG domain.
+        
+        Args:
+            secret_key: Secret key to prove possession of
+            
+        Returns:
+            bytes: Proof of possession (a G2 signature)
+        """
+        if len(secret_key) != 32:
+            raise ValueError("Secret key must be 32 bytes")
+        
+        secret_key_int = int.from_bytes(secret_key, 'big')
+        if not 0 < secret_key_int < self.curve_order:
+            raise ValidationError("Invalid secret key")
+        public_key = _sk_to_pk(secret_key_int)
+        return G2_to_signature(multiply(_hash_message(public_key, bls_pop.POP_TAG), secret_key_int))
+    
+    def pop_verify(self, public_key: bytes, proof: bytes) -> bool:
+        """
+        Verify a proof of possession. Public keys should pass this before
+        they are aggregated, which rules out rogue key attacks.
+        
+        Args:
+            public_key: Public key the proof was made for
+            proof: Proof from pop_prove
+            
+        Returns:
+            bool: True if the proof is valid
+        """
+        pubkey_point = _load_pubkey(public_key)
+        return pubkey_point is not None and self._check_pairing(
+            pubkey_point, public_key, proof, bls_pop.POP_TAG
+        )
+    
+    def fast_aggregate_verify(self, public_keys: List[bytes], message: bytes,
+                              aggregated_signature: bytes) -> bool:
+        """
+        Verify an aggregated signature over one message against the signers'
+        public keys, as in FastAggregateVerify: the keys are summed and the
+        result checked with two pairings. The keys must have passed
+        pop_verify.
+        
+        Args:
+            public_keys: Public keys of the signers
+            message: The message every signer signed
+            aggregated_signature: The aggregated signature
+            
+        Returns:
+            bool: True if the aggregated signature is valid
+        """
+        if not public_keys:
+            return False
+        
+        aggregate = Z1
+        for pk in public_keys:
+            pubkey_point = _load_pubkey(pk)
+            if pubkey_point is None:
+                return False
+            aggregate = add(aggregate, pubkey_point)
+        # KeyValidate on the aggregate: keys that cancel out (pk and -pk)
+        # would otherwise accept the signature at infinity
+        if is_inf(aggregate):
+            return False
+        return self._check_pairing(aggregate, message, aggregated_signature)
+    
     def aggregate_public_keys(self, public_keys: List[bytes]) -> bytes:
         """
         Aggregate multiple public keys with validation.
@@ -173,7 +544,63 @@ class ProductionBLS:
             if len(pk) != 48:  # BLS public key size
                 raise ValueError(f"Invalid public key length: {len(pk)}")
         
-        return bls_pop._AggregatePKs(public_keys)
+        aggregate = Z1
+        for pk in public_keys:
+            pubkey_point = _load_pubkey(pk)
+            if pubkey_point is None:
+                raise ValueError("Invalid public key")
+            aggregate = add(aggregate, pubkey_point)
+        return G1_to_pubkey(aggregate)
+    
+    def set_committee(self, public_keys: List[bytes]) -> None:
+        """
+        Cache the aggregate public key of a committee for
+        aggregate_public_keys_by_exclusion.
+        
+        Args:
+            public_keys: Public key bytes of every committee member
+        """
+        if not public_keys:
+            raise ValueError("Cannot aggregate empty public key list")
+        
+        aggregate = Z1
+        negated = {}
+        for pk in set(public_keys):
+            pubkey_point = _load_pubkey(pk)
+            if pubkey_point is None:
+                raise ValueError("Invalid public key")
+            aggregate = add(aggregate, pubkey_point)
+            negated[pk] = neg(pubkey_point)
+        self._committee_apk = aggregate
+        self._committee_neg = negated
+    
+    def aggregate_public_keys_by_exclusion(self, absent_public_keys: List[bytes]) -> bytes:
+        """
+        Aggregate public key of the committee members that signed, computed
+        from the cached committee aggregate minus the absent members. With
+        high participation this is one point addition per absent key instead
+        of one per signer.
+        
+        Args:
+            absent_public_keys: Public keys of committee members that did not sign
+            
+        Returns:
+            bytes: Aggregated public key of the remaining members
+        """
+        if self._committee_apk is None:
+            raise ValueError("No committee set")
+        
+        absent = set(absent_public_keys)
+        if len(absent) >= len(self._committee_neg):
+            raise ValueError("Cannot aggregate empty public key list")
+        
+        aggregate = self._committee_apk
+        for pk in absent:
+            negated_point = self._committee_neg.get(pk)
+            if negated_point is None:
+                raise ValueError("Public key is not a committee member")
+            aggregate = add(aggregate, negated_point)
+        return G1_to_pubkey(aggregate)
     
     def verify_aggregated_signature(self, 
                                   aggregated_signature: bytes,
@@ -182,6 +609,9 @@ class ProductionBLS:
         """
         Verify an aggregated signature with comprehensive validation.
         
+        All signers signed the same message, so this is the two-pairing check
+        e(agg_sig, G1) == e(H(m), agg_pk) whatever the number of signers.
+        
         Args:
             aggregated_signature: The aggregated signature
             aggregated_public_key: The aggregated public key
@@ -191,16 +621,15 @@ class ProductionBLS:
             bool: True if the aggregated signature is valid
         """
         try:
-            return bls_pop.AggregateVerify(
-                [aggregated_public_key], 
-                [message], 
-                aggregated_signature
+            pubkey_point = _load_pubkey(aggregated_public_key)
+            return pubkey_point is not None and self._check_pairing(
+                pubkey_point, message, aggregated_signature
             )
         except Exception as e:
             print(f"Aggregated signature verification failed: {e}")
             return False
     
-    def serialize_signature(self, signature: BLSSignature) -> str:
+    def serialize_signature(self, signature: BLSSignature) -> bytes:
         """
         Serialize a signature for network transmission or storage.
         
@@ -208,25 +637,55 @@ class ProductionBLS:
             signature: BLSSignature object to serialize
             
         Returns:
-            str: JSON-serialized signature
-        """
-        return json.dumps({
-            "signature": signature.signature.hex(),
-            "public_key": signature.public_key.hex(),
-            "message": signature.message.hex(),
-            "timestamp": signature.timestamp
-        })
+            bytes: Fixed header (timestamp and field lengths) followed by the
+                raw signature, public key and message bytes
+        """
+        header = _SIGNATURE_HEADER.pack(
+            signature.timestamp,
+            len(signature.signature),
+            len(signature.public_key),
+            len(signature.message),
+        )
+        return b"".join((header, signature.signature, signature.public_key, signature.message))
     
-    def deserialize_signature(self, serialized: str) -> BLSSignature:
+    def deserialize_signature(self, serialized: bytes) -> BLSSignature:
         """
         Deserialize a signature from network transmission or storage.
         
         Args:
-            serialized: JSON-serialized signature string
+            serialized: Bytes produced by serialize_signature
             
         Returns:
             BLSSignature: Deserialized signature object
         """
+        view = memoryview(serialized)
+        if len(view) < _SIGNATURE_HEADER.size:
+            raise ValueError("Serialized signature is shorter than its header")
+        timestamp, sig_len, pk_len, msg_len = _SIGNATURE_HEADER.unpack_from(view)
+        pk_start = _SIGNATURE_HEADER.size + sig_len
+        msg_start = pk_start + pk_len
+        if len(view) != msg_start + msg_len:
+            raise ValueError("Serialized signature has the wrong length")
+        return BLSSignature(
+            signature=bytes(view[_SIGNATURE_HEADER.size:pk_start]),
+            public_key=bytes(view[pk_start:msg_start]),
+            message=bytes(view[msg_start:]),
+            timestamp=timestamp
+        )
+    
+    def serialize_signature_str(self, signature: BLSSignature) -> str:
+        """
+        Text form of serialize_signature (base64), for files and JSON documents.
+        """
+        return base64.b64encode(self.serialize_signature(signature)).decode("ascii")
+    
+    def deserialize_signature_str(self, serialized: str) -> BLSSignature:
+        """
+        Deserialize the text form, also accepting the older JSON+hex format.
+        """
+        serialized = serialized.strip()
+        if not serialized.startswith("{"):
+            return self.deserialize_signature(base64.b64decode(serialized, validate=True))
         data = json.loads(serialized)
         return BLSSignature(
             signature=bytes.fromhex(data["signature"]),
@@ -235,21 +694,24 @@ class ProductionBLS:
             timestamp=data["timestamp"]
         )
     
-    def generate_test_data(self, count: int = 10) -> List[BLSSignature]:
+    def generate_test_data(self, count: int = 10,
+                           key_count: Optional[int] = None) -> List[BLSSignature]:
         """
         Generate test data for benchmarking and testing.
         
         Args:
             count: Number of test signatures to generate
+            key_count: Number of distinct signers, used round-robin
+                (defaults to one key pair per signature)
             
         Returns:
             List[BLSSignature]: List of test signatures
         """
+        key_pairs = self.generate_key_pairs(key_count or count, "test_key_")
         test_data = []
         for i in range(count):
-            key_pair = self.generate_key_pair(f"test_key_{i}")
             message = f"test_message_{i}".encode()
-            signature = self.sign_message(message, key_pair.secret_key)
+            signature = self.sign_message(message, key_pairs[i % len(key_pairs)].secret_key)
             test_data.append(signature)
         return test_data
 
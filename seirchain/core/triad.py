@@ -1,3 +1,4 @@
+import hashlib
 import time
 from seirchain.core.crypto import hash_data
 
@@ -10,17 +11,54 @@ class Triad:
         self.vdf_proof = None
         self.nonce = 0
         self.hash = self.calculate_hash()
+        self._encoded_hash = None
 
     def __repr__(self):
         return f"Triad(timestamp={self.timestamp}, transactions={len(self.transactions)}, hash={self.hash})"
 
+    @property
+    def hash_bytes(self):
+        """The UTF-8 encoded hash, cached until the hash changes."""
+        cached = self._encoded_hash
+        if cached is None or cached[0] is not self.hash:
+            cached = (self.hash, self.hash.encode('utf-8'))
+            self._encoded_hash = cached
+        return cached[1]
+
+    def serialize_without_nonce(self):
+        """Returns the encoded hash input that precedes the nonce."""
+        return f"{self.timestamp}{self.transactions}{self.previous_hash}{self.vdf_output}".encode('utf-8')
+
     def calculate_hash(self):
         """Calculates the hash of the Triad."""
         triad_data = f"{self.timestamp}{self.transactions}{self.previous_hash}{self.vdf_output}{self.nonce}"
         return hash_data(triad_data)
 
+    def nonce_hasher(self):
+        """
+        Returns a function mapping a nonce to the Triad hash for that nonce.
+        The nonce-free prefix is serialized and absorbed into SHA-256 once, so
+        each call only hashes the nonce digits.
+        """
+        midstate = hashlib.sha256(self.serialize_without_nonce())
+
+        def hash_nonce(nonce):
+            h = midstate.copy()
+            h.update(b"%d" % nonce)
+            return h.hexdigest()
+
+        return hash_nonce
+
     def mine_triad(self, difficulty):
         """Mines the Triad by finding a hash that starts with a certain number of zeros."""
-        while self.hash[:difficulty] != "0" * difficulty:
-            self.nonce += 1
-            self.hash = self.calculate_hash()
+        target = "0" * difficulty
+        if self.hash.startswith(target):
+            return
+        hash_nonce = self.nonce_hasher()
+        nonce = self.nonce + 1
+        triad_hash = hash_nonce(nonce)
+        while not triad_hash.startswith(target):
+            nonce += 1
+            triad_hash = hash_nonce(nonce)
+        self.nonce = nonce
+        self.hash = triad_hash
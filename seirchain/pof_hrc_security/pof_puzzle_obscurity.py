@@ -1,3 +1,5 @@
+import itertools
+
 from seirchain.core.crypto import hash_data
 
 def get_dynamic_difficulty(vdf_output):
@@ -26,8 +28,20 @@ class ObscurePoFPuzzle:
         if not self.triad.vdf_output:
             raise ValueError("VDF output not present in the Triad.")
 
-        while not check_dynamic_pattern(self.triad.hash, self.triad.vdf_output):
-            self.triad.nonce += 1
-            self.triad.hash = self.triad.calculate_hash()
+        # The pattern only depends on the VDF output, so resolve it once and
+        # keep the per-nonce work down to a hash and a prefix comparison.
+        # Only the nonce varies between attempts, so the rest of the Triad is
+        # serialized and absorbed into the hash state a single time.
+        triad = self.triad
+        target = '0' * get_dynamic_difficulty(triad.vdf_output)
+
+        if not triad.hash.startswith(target):
+            hash_nonce = triad.nonce_hasher()
+            for nonce in itertools.count(triad.nonce + 1):
+                triad_hash = hash_nonce(nonce)
+                if triad_hash.startswith(target):
+                    break
+            triad.nonce = nonce
+            triad.hash = triad_hash
 
-        return self.triad
+        return triad
@@ -1,5 +1,3 @@
-import numpy as np
-
 def is_timestamp_valid(new_triad, parent_triads):
     """
     Validates the timestamp of a new triad based on the median of parent timestamps.
@@ -8,7 +6,8 @@ def is_timestamp_valid(new_triad, parent_triads):
         # Not enough parents to validate, so we assume it's valid for now
         return True
 
-    parent_timestamps = [triad.timestamp for triad in parent_triads[-11:]]
-    median_timestamp = np.median(parent_timestamps)
+    # The window is always exactly 11 parents, so the median is the middle
+    # element of the sorted window; no averaging of two middles is needed
+    median_timestamp = sorted([triad.timestamp for triad in parent_triads[-11:]])[5]
 
     return new_triad.timestamp > median_timestamp
@@ -1,6 +1,11 @@
 class SlashingCondition:
     def __init__(self):
         self.signatures = {}
+        # First triad hash signed by each validator, and the validators that
+        # have since signed a different one; kept up to date by add_signature
+        # so slashing checks don't rescan the signature history.
+        self._first_triad_hash = {}
+        self._conflicting = set()
 
     def add_signature(self, validator_pub_key, triad_hash, signature):
         """
@@ -8,6 +13,9 @@ class SlashingCondition:
         """
         if validator_pub_key not in self.signatures:
             self.signatures[validator_pub_key] = []
+            self._first_triad_hash[validator_pub_key] = triad_hash
+        elif triad_hash != self._first_triad_hash[validator_pub_key]:
+            self._conflicting.add(validator_pub_key)
         self.signatures[validator_pub_key].append((triad_hash, signature))
 
     def check_for_slashing(self, validator_pub_key):
@@ -16,19 +24,10 @@ class SlashingCondition:
         In this simplified model, we consider any two different triad hashes
         at the same height (or for the same previous hash) as conflicting.
         """
-        validator_signatures = self.signatures.get(validator_pub_key, [])
-        if len(validator_signatures) < 2:
-            return False
-
         # In a real implementation, we would need to check the height or
         # previous hash of the triads. For now, we'll assume any two
         # different signatures are for conflicting triads.
-        first_triad_hash, _ = validator_signatures[0]
-        for i in range(1, len(validator_signatures)):
-            other_triad_hash, _ = validator_signatures[i]
-            if first_triad_hash != other_triad_hash:
-                return True
-        return False
+        return validator_pub_key in self._conflicting
 
 class StakingLedger:
     def __init__(self, initial_stakes):
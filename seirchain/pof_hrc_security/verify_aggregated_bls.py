@@ -5,8 +5,7 @@ def verify_triad_signature(triad, public_keys, aggregated_signature):
     """
     Verifies the aggregated signature for a given Triad.
     """
-    message = triad.hash.encode('utf-8')
-    return verify_aggregated_signature(aggregated_signature, public_keys, message)
+    return verify_aggregated_signature(aggregated_signature, public_keys, triad.hash_bytes)
 
 if __name__ == '__main__':
     # 1. Create a Triad
@@ -19,7 +18,7 @@ if __name__ == '__main__':
     public_keys = [key[1] for key in committee_keys]
 
     # 3. Each validator signs the triad hash
-    message = triad.hash.encode('utf-8')
+    message = triad.hash_bytes
     signatures = [sign_message(message, pk) for pk in private_keys]
 
     # 4. Aggregate the signatures
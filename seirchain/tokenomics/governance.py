@@ -13,6 +13,7 @@ class GovernanceContract:
             "parameter": parameter_to_change,
             "new_value": new_value,
             "votes": {},
+            "total_votes": 0,
             "executed": False
         }
         self.next_proposal_id += 1
@@ -23,41 +24,46 @@ class GovernanceContract:
         Allows a token holder to vote on a proposal.
         The vote weight is determined by the voter's stake.
         """
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal does not exist.")
 
-        self.proposals[proposal_id]["votes"][voter_address] = stake
+        votes = proposal["votes"]
+        # Keep the running total in step, replacing any earlier vote
+        proposal["total_votes"] += stake - votes.get(voter_address, 0)
+        votes[voter_address] = stake
 
     def get_proposal_votes(self, proposal_id):
         """
         Gets the total votes for a proposal.
         """
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal does not exist.")
 
-        return sum(self.proposals[proposal_id]["votes"].values())
+        return proposal["total_votes"]
 
     def execute_proposal(self, proposal_id, total_stake, quorum_threshold=0.4, pass_threshold=0.5):
         """
         Executes a proposal if it has met the quorum and pass thresholds.
         """
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError("Proposal does not exist.")
 
-        proposal = self.proposals[proposal_id]
         if proposal["executed"]:
             raise ValueError("Proposal has already been executed.")
 
-        total_votes = self.get_proposal_votes(proposal_id)
+        vote_share = proposal["total_votes"] / total_stake
 
         # Check for quorum
-        if (total_votes / total_stake) < quorum_threshold:
+        if vote_share < quorum_threshold:
             print(f"Proposal {proposal_id} failed: Quorum not met.")
             return False
 
         # In a more complex system, there would be "yes" and "no" votes.
         # For simplicity, we'll assume all votes are "yes" and check against a pass threshold.
-        if (total_votes / total_stake) > pass_threshold:
+        if vote_share > pass_threshold:
             self.params[proposal["parameter"]] = proposal["new_value"]
             proposal["executed"] = True
             print(f"Proposal {proposal_id} passed and executed.")
@@ -1,28 +1,34 @@
 import numpy as np
 
+# All three maps share the same linear part and differ only in translation.
+A = np.array([[0.5, 0], [0, 0.5]])
+B = np.array([[0, 0], [0.5, 0], [0.25, 0.5 * (3**0.5 / 2)]])
+
 def f1(p):
   """
   Transformation 1: Scale by 1/2 and move to the bottom-left.
   """
-  A = np.array([[0.5, 0], [0, 0.5]])
-  b = np.array([0, 0])
-  return np.dot(A, p) + b
+  return np.dot(A, p) + B[0]
 
 def f2(p):
   """
   Transformation 2: Scale by 1/2 and move to the bottom-right.
   """
-  A = np.array([[0.5, 0], [0, 0.5]])
-  b = np.array([0.5, 0])
-  return np.dot(A, p) + b
+  return np.dot(A, p) + B[1]
 
 def f3(p):
   """
   Transformation 3: Scale by 1/2 and move to the top.
   """
-  A = np.array([[0.5, 0], [0, 0.5]])
-  b = np.array([0.25, 0.5 * (3**0.5 / 2)])
-  return np.dot(A, p) + b
+  return np.dot(A, p) + B[2]
+
+def apply_all(points):
+  """
+  Applies f1, f2 and f3 to a batch of points in one vectorized call.
+  points: array of shape (N, 2).
+  Returns an array of shape (3, N, 2) where [i] holds the image under f(i+1).
+  """
+  return np.asarray(points) @ A.T + B[:, None, :]
 
 if __name__ == '__main__':
   # Starting point
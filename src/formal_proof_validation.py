@@ -1,18 +1,53 @@
 import hashlib
 
+from seirchain.crypto.sha256 import sha256_one
+
 class Transaction:
+    __slots__ = ('_from_address', '_to_address', '_amount', 'signature', '_hash')
+
     def __init__(self, from_address, to_address, amount, signature=None):
-        self.from_address = from_address
-        self.to_address = to_address
-        self.amount = amount
+        self._from_address = from_address
+        self._to_address = to_address
+        self._amount = amount
         self.signature = signature
+        self._hash = None
+
+    # The hashed fields clear the cached hash when reassigned
+    @property
+    def from_address(self):
+        return self._from_address
+
+    @from_address.setter
+    def from_address(self, value):
+        self._from_address = value
+        self._hash = None
+
+    @property
+    def to_address(self):
+        return self._to_address
+
+    @to_address.setter
+    def to_address(self, value):
+        self._to_address = value
+        self._hash = None
+
+    @property
+    def amount(self):
+        return self._amount
+
+    @amount.setter
+    def amount(self, value):
+        self._amount = value
+        self._hash = None
 
     def calculate_hash(self):
         """
-        Calculates the hash of the transaction.
+        Calculates the hash of the transaction, memoized until a hashed field changes.
         """
-        tx_string = f"{self.from_address}{self.to_address}{self.amount}"
-        return hashlib.sha256(tx_string.encode()).hexdigest()
+        if self._hash is None:
+            tx_string = f"{self._from_address}{self._to_address}{self._amount}"
+            self._hash = sha256_one(tx_string.encode()).hex()
+        return self._hash
 
     def sign(self, private_key):
         """
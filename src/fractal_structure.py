@@ -1,24 +1,48 @@
 import os
 
+def _write_file(file_path, text):
+    """
+    Writes a small file with raw os-level calls, skipping the buffered
+    text file object that open() would build for every file.
+    """
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        os.write(fd, text.encode())
+    finally:
+        os.close(fd)
+
 def create_fractal_structure(base_path, level, max_level):
     """
-    Recursively creates a fractal directory and file structure.
+    Creates a fractal directory and file structure.
+
+    The tree is walked with an explicit stack in pre-order, so every parent
+    directory exists before its children and a plain mkdir suffices below
+    base_path.
     """
     if level > max_level:
         return
 
-    for i in range(3):
-        # Create a directory for each branch of the fractal
-        dir_path = os.path.join(base_path, f"branch_{i}")
-        os.makedirs(dir_path, exist_ok=True)
+    os.makedirs(base_path, exist_ok=True)
+    stack = [(base_path, level)]
+    while stack:
+        path, level = stack.pop()
+        children = []
+        for i in range(3):
+            # Create a directory for each branch of the fractal
+            dir_path = f"{path}/branch_{i}"
+            try:
+                os.mkdir(dir_path)
+            except FileExistsError:
+                pass
 
-        # Create a file in the directory
-        file_path = os.path.join(dir_path, f"data_level_{level}.txt")
-        with open(file_path, 'w') as f:
-            f.write(f"This is data for level {level}, branch {i}.")
+            # Create a file in the directory
+            _write_file(f"{dir_path}/data_level_{level}.txt",
+                        f"This is data for level {level}, branch {i}.")
 
-        # Recurse to the next level
-        create_fractal_structure(dir_path, level + 1, max_level)
+            if level < max_level:
+                children.append((dir_path, level + 1))
+        # Reverse so branch_0's subtree is visited first, as the recursion did
+        stack.extend(reversed(children))
 
 if __name__ == '__main__':
     base_dir = "fractal_file_system"
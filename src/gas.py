@@ -1,3 +1,5 @@
+import numpy as np
+
 OPCODE_GAS_COSTS = {
     "ADD": 3,
     "SUB": 3,
@@ -10,6 +12,36 @@ OPCODE_GAS_COSTS = {
     "STORE": 5,
 }
 
+# Single-byte encoding of the opcodes above, following the EVM numbering
+OPCODE_BYTES = {
+    "STOP": 0x00,
+    "ADD": 0x01,
+    "MUL": 0x02,
+    "SUB": 0x03,
+    "DIV": 0x04,
+    "POP": 0x50,
+    "LOAD": 0x51,
+    "STORE": 0x52,
+    "PUSH": 0x60,
+}
+
+# Gas cost indexed by opcode byte; unassigned bytes cost 1 like unknown opcodes
+OPCODE_COST_LUT = np.ones(256, dtype=np.uint32)
+OPCODE_COST_LUT[list(OPCODE_BYTES.values())] = [OPCODE_GAS_COSTS[name] for name in OPCODE_BYTES]
+
+class _OpcodeCostTable(dict):
+    """
+    Gas cost by opcode spelling. Upper- and lowercase names are stored
+    directly; any other spelling falls back to a case-insensitive lookup
+    without being stored, so arbitrary input cannot grow the table.
+    """
+
+    def __missing__(self, opcode: str) -> int:
+        return OPCODE_GAS_COSTS.get(opcode.upper(), 1)  # Default to 1 for unknown opcodes
+
+_OPCODE_COSTS = _OpcodeCostTable(OPCODE_GAS_COSTS)
+_OPCODE_COSTS.update({name.lower(): cost for name, cost in OPCODE_GAS_COSTS.items()})
+
 def calculate_gas(opcodes: list[str]) -> int:
     """
     Calculates the execution cost of a smart contract based on its operation codes.
@@ -20,7 +52,21 @@ def calculate_gas(opcodes: list[str]) -> int:
     Returns:
         The total gas cost.
     """
-    total_gas = 0
-    for opcode in opcodes:
-        total_gas += OPCODE_GAS_COSTS.get(opcode.upper(), 1)  # Default to 1 for unknown opcodes
-    return total_gas
+    # Common spellings hit the table directly, so the loop stays in C
+    return sum(map(_OPCODE_COSTS.__getitem__, opcodes))
+
+def calculate_gas_bytes(code: bytes) -> int:
+    """
+    Calculates the execution cost of byte-encoded bytecode, one byte per opcode.
+
+    The whole stream is priced with a single table lookup and sum, so long
+    bytecode does not go through the interpreter opcode by opcode.
+
+    Args:
+        code: The bytecode, with opcodes encoded as in OPCODE_BYTES.
+
+    Returns:
+        The total gas cost.
+    """
+    opcodes = np.frombuffer(code, dtype=np.uint8)
+    return int(OPCODE_COST_LUT.take(opcodes).sum(dtype=np.uint64))
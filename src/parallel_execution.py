@@ -1,5 +1,13 @@
-import multiprocessing
+import os
+import threading
 import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+# Executors are created on first use and reused across calls, so
+# transactions don't pay for spinning up workers every time.
+_io_executor = None
+_cpu_executor = None
+_executor_lock = threading.Lock()
 
 def transaction_task(tx_id, duration):
     """A dummy transaction that takes a certain amount of time."""
@@ -8,6 +16,50 @@ def transaction_task(tx_id, duration):
     print(f"Transaction {tx_id} finished.")
     return tx_id * 2
 
+def _get_io_executor():
+    global _io_executor
+    with _executor_lock:
+        if _io_executor is None:
+            _io_executor = ThreadPoolExecutor(max_workers=(os.cpu_count() or 1) * 4)
+        return _io_executor
+
+def _get_cpu_executor():
+    global _cpu_executor
+    with _executor_lock:
+        if _cpu_executor is None:
+            _cpu_executor = ProcessPoolExecutor()
+        return _cpu_executor
+
+def execute_parallel_io(transactions, task=transaction_task):
+    """
+    Executes light or I/O-bound transactions on a shared thread pool.
+
+    Threads avoid pickling the arguments and results, which dominates
+    for short transactions.
+
+    Args:
+        transactions: A list of argument tuples for `task`.
+        task: The transaction function to run.
+
+    Returns:
+        A list of results, in the same order as the transactions.
+    """
+    return list(_get_io_executor().map(task, *zip(*transactions)))
+
+def execute_parallel_cpu(transactions, task=transaction_task, chunksize=1):
+    """
+    Executes CPU-bound transactions on a shared process pool.
+
+    Args:
+        transactions: A list of argument tuples for `task`.
+        task: The transaction function to run; it must be picklable.
+        chunksize: How many transactions to send to a worker at a time.
+
+    Returns:
+        A list of results, in the same order as the transactions.
+    """
+    return list(_get_cpu_executor().map(task, *zip(*transactions), chunksize=chunksize))
+
 def execute_parallel(transactions):
     """
     Simulates the parallel execution of transactions within a single Triad.
@@ -19,6 +71,4 @@ def execute_parallel(transactions):
     Returns:
         A list of results from the executed transactions.
     """
-    with multiprocessing.Pool() as pool:
-        results = pool.starmap(transaction_task, transactions)
-    return results
+    return execute_parallel_io(transactions)
@@ -1,15 +1,24 @@
+import itertools
+from concurrent.futures import ProcessPoolExecutor
+
 from py_ecc.bls import G2ProofOfPossession as bls_pop
 
-def generate_validator_keys(num_validators):
+def _generate_validator_key(index):
+    private_key = bls_pop.KeyGen(bytes([index]))
+    public_key = bls_pop.SkToPk(private_key)
+    return {"private_key": private_key, "public_key": public_key}
+
+def generate_validator_keys(num_validators, max_workers=1):
     """
     Generates a list of validator private and public keys.
+
+    py_ecc is pure Python and CPU-bound, so with max_workers other than 1
+    the keys are derived in a process pool (None uses every CPU).
     """
-    validators = []
-    for _ in range(num_validators):
-        private_key = bls_pop.KeyGen(bytes([_]))
-        public_key = bls_pop.SkToPk(private_key)
-        validators.append({"private_key": private_key, "public_key": public_key})
-    return validators
+    if max_workers == 1:
+        return [_generate_validator_key(i) for i in range(num_validators)]
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(_generate_validator_key, range(num_validators)))
 
 def sign_message(private_key, message):
     """
@@ -17,6 +26,15 @@ def sign_message(private_key, message):
     """
     return bls_pop.Sign(private_key, message)
 
+def sign_message_batch(private_keys, message, max_workers=None):
+    """
+    Signs one message with many private keys in a process pool.
+
+    Returns the signatures in the same order as the private keys.
+    """
+    with ProcessPoolExecutor(max_workers=max_workers) as pool:
+        return list(pool.map(sign_message, private_keys, itertools.repeat(message)))
+
 def aggregate_signatures(signatures):
     """
     Aggregates a list of signatures into a single signature.
@@ -34,3 +52,22 @@ def verify_aggregated_signature(aggregated_signature, aggregated_public_key, mes
     Verifies an aggregated signature against an aggregated public key and a message.
     """
     return bls_pop.Verify(aggregated_public_key, message, aggregated_signature)
+
+def fast_aggregate_verify(public_keys, message, aggregated_signature):
+    """
+    Verifies an aggregated signature from signers that all signed the same message.
+
+    The public keys are summed first, so verification costs a single
+    pairing check however many validators signed. Malformed keys, an empty
+    key list or an aggregate at infinity fail verification.
+    """
+    return bls_pop.FastAggregateVerify(public_keys, message, aggregated_signature)
+
+def aggregate_verify(public_keys, messages, aggregated_signature):
+    """
+    Verifies an aggregated signature where each signer signed its own message.
+
+    Needs one pairing per signer; prefer fast_aggregate_verify when every
+    signer signed the same message.
+    """
+    return bls_pop.AggregateVerify(public_keys, messages, aggregated_signature)
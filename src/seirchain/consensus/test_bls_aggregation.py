@@ -2,9 +2,12 @@ import pytest
 from .bls_aggregation import (
     generate_validator_keys,
     sign_message,
+    sign_message_batch,
     aggregate_signatures,
     aggregate_public_keys,
     verify_aggregated_signature,
+    fast_aggregate_verify,
+    aggregate_verify,
 )
 
 @pytest.fixture
@@ -55,3 +58,35 @@ def test_bls_aggregation_invalid_message(validators, message):
     invalid_message = b"This is an invalid message"
 
     assert not verify_aggregated_signature(aggregated_signature, aggregated_public_key, invalid_message)
+
+def test_bls_parallel_signing(validators, message):
+    private_keys = [validator["private_key"] for validator in validators]
+
+    signatures = sign_message_batch(private_keys, message, max_workers=2)
+
+    assert signatures == [sign_message(private_key, message) for private_key in private_keys]
+    assert generate_validator_keys(3, max_workers=2) == validators[:3]
+
+def test_bls_fast_aggregate_verify(validators, message):
+    signatures = [sign_message(validator["private_key"], message) for validator in validators]
+    public_keys = [validator["public_key"] for validator in validators]
+
+    aggregated_signature = aggregate_signatures(signatures)
+
+    assert fast_aggregate_verify(public_keys, message, aggregated_signature)
+    assert not fast_aggregate_verify(public_keys[1:], message, aggregated_signature)
+    assert not fast_aggregate_verify([], message, aggregated_signature)
+    assert not fast_aggregate_verify([b"\x00" * 48], message, aggregated_signature)
+
+def test_bls_aggregate_verify_distinct_messages(validators):
+    messages = [f"message {i}".encode() for i in range(len(validators))]
+    signatures = [
+        sign_message(validator["private_key"], msg)
+        for validator, msg in zip(validators, messages)
+    ]
+    public_keys = [validator["public_key"] for validator in validators]
+
+    aggregated_signature = aggregate_signatures(signatures)
+
+    assert aggregate_verify(public_keys, messages, aggregated_signature)
+    assert not aggregate_verify(public_keys, messages[::-1], aggregated_signature)
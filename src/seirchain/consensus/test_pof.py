@@ -8,3 +8,22 @@ class TestProofOfFractal(unittest.TestCase):
         puzzle = pof.create_puzzle("test data")
         nonce = pof.solve_puzzle(puzzle)
         self.assertTrue(pof.verify_solution(puzzle, nonce))
+
+    def test_pof_parallel(self):
+        pof = ProofOfFractal(difficulty=3)
+        puzzle = pof.create_puzzle("test data")
+        nonce = pof.solve_puzzle(puzzle, workers=2)
+        self.assertEqual(nonce, pof.solve_puzzle(puzzle))
+        self.assertTrue(pof.verify_solution(puzzle, nonce))
+
+    def test_unsolvable_difficulty(self):
+        pof = ProofOfFractal(difficulty=65)
+        puzzle = pof.create_puzzle("test data")
+        self.assertIsNone(pof.solve_puzzle(puzzle))
+
+    def test_verify_rejects_non_int_nonce(self):
+        pof = ProofOfFractal(difficulty=1)
+        puzzle = pof.create_puzzle("test data")
+        nonce = pof.solve_puzzle(puzzle)
+        for bad in (None, str(nonce), float(nonce), True):
+            self.assertFalse(pof.verify_solution(puzzle, bad))
@@ -0,0 +1,9 @@
+"""
+SeirChain Cryptographic Primitives
+
+Shared hashing helpers used by consensus, ledger structures and transactions.
+"""
+
+from .sha256 import sha256_one, sha256_pair64, sha256_batch, sha256_midstate, sha256_resume
+
+__all__ = ['sha256_one', 'sha256_pair64', 'sha256_batch', 'sha256_midstate', 'sha256_resume']
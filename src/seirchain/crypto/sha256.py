@@ -0,0 +1,86 @@
+"""
+SHA-256 Backend
+
+Single entry point for SHA-256 across PoF, Triad Merkle trees and
+transactions, so every hot spot picks up a faster backend in one place.
+
+hashlib's OpenSSL implementation already dispatches at runtime to SHA-NI,
+AVX2 or SSSE3 code paths depending on the CPU, so it is the backend used
+here. Call sites choose the granularity that fits them: a single message,
+a 64-byte Merkle pair, a batch, or a resumable midstate.
+"""
+
+import hashlib
+from typing import Iterable, List
+
+_sha256 = hashlib.sha256
+
+
+def sha256_one(data: bytes) -> bytes:
+    """
+    Hashes a single message.
+
+    Args:
+        data: The message to hash.
+
+    Returns:
+        The 32-byte digest.
+    """
+    return _sha256(data).digest()
+
+
+def sha256_pair64(left: bytes, right: bytes) -> bytes:
+    """
+    Hashes the concatenation of two 32-byte digests, i.e. one Merkle node.
+
+    Args:
+        left: The left child digest.
+        right: The right child digest.
+
+    Returns:
+        The 32-byte digest of the parent node.
+    """
+    return _sha256(left + right).digest()
+
+
+def sha256_batch(messages: Iterable[bytes]) -> List[bytes]:
+    """
+    Hashes many independent messages.
+
+    Args:
+        messages: The messages to hash.
+
+    Returns:
+        The 32-byte digests, in input order.
+    """
+    return [_sha256(message).digest() for message in messages]
+
+
+def sha256_midstate(prefix: bytes):
+    """
+    Absorbs a fixed prefix once so it can be resumed for many suffixes.
+
+    Args:
+        prefix: The data common to every message.
+
+    Returns:
+        A hash object holding the midstate; pass it to sha256_resume, or
+        call its copy() directly in hot loops.
+    """
+    return _sha256(prefix)
+
+
+def sha256_resume(midstate, suffix: bytes) -> bytes:
+    """
+    Finishes a hash from a midstate without disturbing it.
+
+    Args:
+        midstate: A hash object returned by sha256_midstate.
+        suffix: The data following the prefix.
+
+    Returns:
+        The 32-byte digest of prefix + suffix.
+    """
+    h = midstate.copy()
+    h.update(suffix)
+    return h.digest()
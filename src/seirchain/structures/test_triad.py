@@ -1,6 +1,19 @@
+import hashlib
 import unittest
 from seirchain.structures.triad import Triad, compute_merkle_root
 
+def reference_merkle_root(transactions):
+    """Plain level-by-level Merkle root over raw SHA-256 digests."""
+    if not transactions:
+        return ""
+    level = [hashlib.sha256(tx.encode()).digest() for tx in transactions]
+    while len(level) > 1:
+        if len(level) % 2:
+            level.append(level[-1])
+        level = [hashlib.sha256(level[i] + level[i + 1]).digest()
+                 for i in range(0, len(level), 2)]
+    return level[0].hex()
+
 class TestTriad(unittest.TestCase):
 
     def test_merkle_root(self):
@@ -16,3 +29,16 @@ class TestTriad(unittest.TestCase):
         self.assertEqual(triad.parent_hash, "parent_hash")
         self.assertEqual(triad.pof_data, "pof_data")
         self.assertIsNotNone(triad.merkle_root)
+
+    def test_add_transaction(self):
+        triad = Triad([], "parent_hash", "pof_data")
+        self.assertEqual(triad.merkle_root, "")
+        for i in range(13):
+            triad.add_transaction(f"tx{i}")
+            self.assertEqual(triad.merkle_root, reference_merkle_root(triad.transactions))
+
+    def test_merkle_root_matches_reference(self):
+        for size in (0, 1, 2, 3, 5, 6, 7, 8, 9, 16, 17, 31, 100):
+            transactions = [f"tx{i}" for i in range(size)]
+            self.assertEqual(compute_merkle_root(transactions),
+                             reference_merkle_root(transactions), size)
@@ -4,31 +4,80 @@ Triad Data Structure
 This module defines the Triad data structure, the fundamental unit of the SeirChain ledger.
 """
 
-import hashlib
-from typing import List, Any
+from typing import List, Any, Optional
 
-def compute_merkle_root(transactions: List[str]) -> str:
+from seirchain.crypto.sha256 import sha256_one, sha256_pair64
+
+class MerkleAccumulator:
     """
-    Computes the Merkle root for a list of transactions.
+    Streaming Merkle root builder.
+
+    Keeps at most one pending hash per tree level, so adding a transaction
+    costs O(log N) hashes and memory stays O(log N). The root matches
+    compute_merkle_root, including duplicating the last hash of odd levels.
+
+    Nodes are kept as raw 32-byte digests, so each internal node hashes a
+    single 64-byte block; only the root is hex-encoded.
     """
-    if not transactions:
-        return ""
 
-    transaction_hashes = [hashlib.sha256(tx.encode()).hexdigest() for tx in transactions]
+    def __init__(self):
+        self._levels: List[Optional[bytes]] = []
 
-    while len(transaction_hashes) > 1:
-        if len(transaction_hashes) % 2 != 0:
-            transaction_hashes.append(transaction_hashes[-1])
+    _hash_pair = staticmethod(sha256_pair64)
 
-        new_hashes = []
-        for i in range(0, len(transaction_hashes), 2):
-            combined_hash = hashlib.sha256(
-                (transaction_hashes[i] + transaction_hashes[i+1]).encode()
-            ).hexdigest()
-            new_hashes.append(combined_hash)
-        transaction_hashes = new_hashes
+    def add_transaction(self, tx: str) -> None:
+        """
+        Adds the next transaction, merging completed subtrees upwards.
+        """
+        node = sha256_one(tx.encode())
+        levels = self._levels
+        level = 0
+        while level < len(levels) and levels[level] is not None:
+            node = self._hash_pair(levels[level], node)
+            levels[level] = None
+            level += 1
+        if level == len(levels):
+            levels.append(node)
+        else:
+            levels[level] = node
+
+    def merkle_root(self) -> str:
+        """
+        Folds the pending subtrees into the root. Touches only the O(log N)
+        frontier; the accumulator itself is left unchanged.
+        """
+        levels = self._levels
+        top = len(levels) - 1
+        while top >= 0 and levels[top] is None:
+            top -= 1
+        if top < 0:
+            return ""
 
-    return transaction_hashes[0]
+        carry = None
+        for level in range(top + 1):
+            node = levels[level]
+            if carry is None:
+                if node is None:
+                    continue
+                if level == top:
+                    return node.hex()
+                # A lone node at an odd-sized level is paired with itself
+                carry = self._hash_pair(node, node)
+            elif node is None:
+                carry = self._hash_pair(carry, carry)
+            else:
+                carry = self._hash_pair(node, carry)
+        return carry.hex()
+
+
+def compute_merkle_root(transactions: List[str]) -> str:
+    """
+    Computes the Merkle root for a list of transactions.
+    """
+    accumulator = MerkleAccumulator()
+    for tx in transactions:
+        accumulator.add_transaction(tx)
+    return accumulator.merkle_root()
 
 class Triad:
     """
@@ -47,8 +96,19 @@ class Triad:
         self.transactions = transactions
         self.parent_hash = parent_hash
         self.pof_data = pof_data
-        self.merkle_root = compute_merkle_root(self.transactions)
+        self._merkle = MerkleAccumulator()
+        for tx in self.transactions:
+            self._merkle.add_transaction(tx)
+        self.merkle_root = self._merkle.merkle_root()
         self.child_references = []
 
+    def add_transaction(self, tx: str) -> None:
+        """
+        Appends a transaction and updates the Merkle root in O(log N).
+        """
+        self.transactions.append(tx)
+        self._merkle.add_transaction(tx)
+        self.merkle_root = self._merkle.merkle_root()
+
     def __str__(self):
         return f"Triad(merkle_root='{self.merkle_root}', parent_hash='{self.parent_hash}')"
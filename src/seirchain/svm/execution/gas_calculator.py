@@ -91,6 +91,16 @@ class Opcode(Enum):
     SELFDESTRUCT = 5000
 
 
+# Call operations, charged extra per byte of call data.
+_CALL_OPCODES = frozenset({
+    Opcode.CALL, Opcode.CALLCODE, Opcode.DELEGATECALL, Opcode.STATICCALL,
+})
+
+# Opcodes whose cost depends on their arguments; every other opcode is
+# charged its flat base cost.
+_DYNAMIC_GAS_OPCODES = frozenset({Opcode.SHA3, Opcode.SSTORE}) | _CALL_OPCODES
+
+
 class GasCalculator:
     """
     Calculates gas costs for smart contract execution based on operation codes.
@@ -138,8 +148,7 @@ class GasCalculator:
                 else:
                     return 5000   # Storage update
         
-        elif opcode in [Opcode.CALL, Opcode.CALLCODE, 
-                       Opcode.DELEGATECALL, Opcode.STATICCALL]:
+        elif opcode in _CALL_OPCODES:
             # Call operations have additional gas based on call data
             if args and len(args) > 0:
                 call_data_size = args[0] if args[0] else 0
@@ -160,9 +169,10 @@ class GasCalculator:
         if memory_size == 0:
             return 0
             
-        # Memory gas cost is quadratic
-        words = (memory_size + 31) // 32
-        return words * self.memory_gas_cost + (words * words) // 512
+        # Memory gas cost is quadratic: words = ceil(size / 32) and the
+        # quadratic term is words**2 / 512, both done as shifts
+        words = (memory_size + 31) >> 5
+        return words * self.memory_gas_cost + ((words * words) >> 9)
     
     def calculate_storage_gas(self, storage_slots: int) -> int:
         """
@@ -195,12 +205,17 @@ class GasCalculator:
         memory_gas = 0
         storage_gas = 0
         
-        # Calculate opcode gas
+        # Calculate opcode gas. Flat-cost opcodes are charged straight from
+        # the cost table; only argument-dependent ones go through
+        # calculate_opcode_gas.
+        base_gas_costs = self.base_gas_costs
+        calculate_opcode_gas = self.calculate_opcode_gas
         for operation in bytecode:
             opcode = operation.get('opcode')
-            args = operation.get('args', [])
-            gas = self.calculate_opcode_gas(opcode, *args)
-            opcode_gas += gas
+            if opcode in _DYNAMIC_GAS_OPCODES:
+                opcode_gas += calculate_opcode_gas(opcode, *operation.get('args', []))
+            else:
+                opcode_gas += base_gas_costs.get(opcode, 0)
             
         # Calculate memory gas
         memory_gas = self.calculate_memory_gas(memory_size)
@@ -5,13 +5,19 @@ Implements the SVM's optimistic concurrency by creating a TransactionalMemory
 class that tracks read/write sets for transactions within the Triad Matrix.
 """
 
+import os
 import threading
 import time
 from typing import Dict, Set, Any, List, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum
 
 
+def _stripe_count() -> int:
+    """Number of key lock stripes: next power of two >= 4 * CPU count."""
+    return 1 << ((os.cpu_count() or 1) * 4 - 1).bit_length()
+
+
 class TransactionState(Enum):
     """States of a transaction in optimistic concurrency control."""
     ACTIVE = "active"
@@ -29,6 +35,9 @@ class TransactionRecord:
     state: TransactionState
     timestamp: float
     triad_id: int
+    read_snapshot_version: int = 0
+    # Guards read_set/write_set against the switch out of ACTIVE
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
 
 
 class TransactionalMemory:
@@ -43,8 +52,31 @@ class TransactionalMemory:
         """Initialize the transactional memory system."""
         self.transactions: Dict[str, TransactionRecord] = {}
         self.global_state: Dict[str, Any] = {}
+        # Guards transaction metadata (records, active set, version counter);
+        # commits also hold it while applying writes, so a snapshot never
+        # sees a version whose writes are not in place yet
         self.lock = threading.RLock()
+        # Guard global_state/key_write_version, striped by key hash; always
+        # taken before self.lock
+        self.stripes = [threading.Lock() for _ in range(_stripe_count())]
+        self._stripe_mask = len(self.stripes) - 1
         self.version_counter = 0
+        # Version at which each key was last written by a committed transaction
+        self.key_write_version: Dict[str, int] = {}
+        self.active_tx_ids: Set[str] = set()
+        
+    def _stripe_indices(self, keys) -> List[int]:
+        """Sorted, de-duplicated stripe indices covering keys."""
+        mask = self._stripe_mask
+        return sorted({hash(key) & mask for key in keys})
+    
+    def _acquire_stripes(self, indices: List[int]):
+        for i in indices:
+            self.stripes[i].acquire()
+    
+    def _release_stripes(self, indices: List[int]):
+        for i in reversed(indices):
+            self.stripes[i].release()
         
     def begin_transaction(self, tx_id: str, triad_id: int) -> bool:
         """
@@ -67,8 +99,10 @@ class TransactionalMemory:
                 write_set=set(),
                 state=TransactionState.ACTIVE,
                 timestamp=time.time(),
-                triad_id=triad_id
+                triad_id=triad_id,
+                read_snapshot_version=self.version_counter
             )
+            self.active_tx_ids.add(tx_id)
             return True
     
     def read(self, tx_id: str, key: str) -> Any:
@@ -82,18 +116,19 @@ class TransactionalMemory:
         Returns:
             Value associated with the key
         """
-        with self.lock:
-            if tx_id not in self.transactions:
-                raise ValueError(f"Transaction {tx_id} not found")
-                
-            tx = self.transactions[tx_id]
+        # Record lookups are atomic dict reads; only the key's stripe is locked
+        tx = self.transactions.get(tx_id)
+        if tx is None:
+            raise ValueError(f"Transaction {tx_id} not found")
+            
+        # Add to read set
+        with tx.lock:
             if tx.state != TransactionState.ACTIVE:
                 raise ValueError(f"Transaction {tx_id} not active")
-                
-            # Add to read set
             tx.read_set.add(key)
-            
-            # Return current value
+        
+        # Return current value
+        with self.stripes[hash(key) & self._stripe_mask]:
             return self.global_state.get(key)
     
     def write(self, tx_id: str, key: str, value: Any) -> bool:
@@ -108,17 +143,16 @@ class TransactionalMemory:
         Returns:
             True if write was successful
         """
-        with self.lock:
-            if tx_id not in self.transactions:
-                return False
-                
-            tx = self.transactions[tx_id]
+        tx = self.transactions.get(tx_id)
+        if tx is None:
+            return False
+            
+        # Add to write set
+        with tx.lock:
             if tx.state != TransactionState.ACTIVE:
                 return False
-                
-            # Add to write set
             tx.write_set.add(key)
-            return True
+        return True
     
     def validate_transaction(self, tx_id: str) -> bool:
         """
@@ -135,27 +169,33 @@ class TransactionalMemory:
                 return False
                 
             tx = self.transactions[tx_id]
-            if tx.state != TransactionState.ACTIVE:
-                return False
-                
-            tx.state = TransactionState.VALIDATING
+            with tx.lock:
+                if tx.state != TransactionState.ACTIVE:
+                    return False
+                # read_set/write_set are frozen from here on
+                tx.state = TransactionState.VALIDATING
+            self.active_tx_ids.discard(tx_id)
             
-            # Check for conflicts with other transactions
-            for other_tx_id, other_tx in self.transactions.items():
-                if other_tx_id == tx_id:
-                    continue
+        # A conflict is any key written by a transaction that committed
+        # after this one took its snapshot
+        snapshot = tx.read_snapshot_version
+        key_write_version = self.key_write_version
+        stripes = self._stripe_indices(tx.read_set | tx.write_set)
+        self._acquire_stripes(stripes)
+        try:
+            # Check for write-write conflicts
+            for key in tx.write_set:
+                if key_write_version.get(key, -1) > snapshot:
+                    return False
                     
-                # Check for write-write conflicts
-                if other_tx.state == TransactionState.COMMITTED:
-                    if tx.write_set & other_tx.write_set:
-                        return False
-                        
-                # Check for read-write conflicts
-                if other_tx.state == TransactionState.COMMITTED:
-                    if tx.read_set & other_tx.write_set:
-                        return False
-            
-            return True
+            # Check for read-write conflicts
+            for key in tx.read_set:
+                if key_write_version.get(key, -1) > snapshot:
+                    return False
+        finally:
+            self._release_stripes(stripes)
+        
+        return True
     
     def commit_transaction(self, tx_id: str) -> bool:
         """
@@ -175,15 +215,25 @@ class TransactionalMemory:
             if tx.state != TransactionState.VALIDATING:
                 return False
             
-            # Apply writes to global state
-            for key in tx.write_set:
-                # In a real implementation, we'd store the actual values
-                # For now, we'll just mark them as modified
-                self.global_state[key] = f"modified_by_{tx_id}"
-            
             tx.state = TransactionState.COMMITTED
-            self.version_counter += 1
-            return True
+        
+        # Apply writes to global state. The version is bumped and the writes
+        # applied in one step under self.lock, so begin_transaction either
+        # snapshots before this commit (and its reads conflict) or after it
+        stripes = self._stripe_indices(tx.write_set)
+        self._acquire_stripes(stripes)
+        try:
+            with self.lock:
+                self.version_counter += 1
+                version = self.version_counter
+                for key in tx.write_set:
+                    # In a real implementation, we'd store the actual values
+                    # For now, we'll just mark them as modified
+                    self.global_state[key] = f"modified_by_{tx_id}"
+                    self.key_write_version[key] = version
+        finally:
+            self._release_stripes(stripes)
+        return True
     
     def abort_transaction(self, tx_id: str) -> bool:
         """
@@ -200,7 +250,9 @@ class TransactionalMemory:
                 return False
                 
             tx = self.transactions[tx_id]
-            tx.state = TransactionState.ABORTED
+            with tx.lock:
+                tx.state = TransactionState.ABORTED
+            self.active_tx_ids.discard(tx_id)
             return True
     
     def get_transaction_state(self, tx_id: str) -> Optional[TransactionState]:
@@ -228,12 +280,10 @@ class TransactionalMemory:
             List of active transaction IDs
         """
         with self.lock:
-            active = []
-            for tx_id, tx in self.transactions.items():
-                if tx.state == TransactionState.ACTIVE:
-                    if triad_id is None or tx.triad_id == triad_id:
-                        active.append(tx_id)
-            return active
+            if triad_id is None:
+                return list(self.active_tx_ids)
+            return [tx_id for tx_id in self.active_tx_ids
+                    if self.transactions[tx_id].triad_id == triad_id]
     
     def get_conflict_summary(self) -> Dict[str, Any]:
         """
@@ -244,8 +294,7 @@ class TransactionalMemory:
         """
         with self.lock:
             total = len(self.transactions)
-            active = sum(1 for tx in self.transactions.values() 
-                        if tx.state == TransactionState.ACTIVE)
+            active = len(self.active_tx_ids)
             committed = sum(1 for tx in self.transactions.values() 
                           if tx.state == TransactionState.COMMITTED)
             aborted = sum(1 for tx in self.transactions.values() 
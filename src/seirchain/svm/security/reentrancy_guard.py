@@ -2,33 +2,29 @@
 Reentrancy Attack Protection
 
 Implements reentrancy guards to protect smart contracts from reentrancy attacks
-using mutex locks and state management.
+by tracking which contracts are currently executing.
 """
 
-import threading
 from typing import Dict, Any, Optional
 from contextlib import contextmanager
 
 
 class ReentrancyGuard:
     """
-    Provides reentrancy protection for smart contracts using mutex locks.
+    Provides reentrancy protection for smart contracts.
+    
+    A contract is locked while its address is present in the call stack map.
+    Entry claims the address with a single dict.setdefault, which is atomic
+    under the GIL, so no per-contract mutex is needed.
     """
     
     def __init__(self):
         """Initialize the reentrancy guard."""
-        self._locks: Dict[str, threading.Lock] = {}
-        self._call_stack: Dict[str, int] = {}
-        
-    def _get_lock(self, contract_address: str) -> threading.Lock:
-        """Get or create a lock for a specific contract."""
-        if contract_address not in self._locks:
-            self._locks[contract_address] = threading.Lock()
-        return self._locks[contract_address]
+        self._call_stack: Dict[str, object] = {}
     
     def is_locked(self, contract_address: str) -> bool:
         """Check if a contract is currently locked."""
-        return self._call_stack.get(contract_address, 0) > 0
+        return contract_address in self._call_stack
     
     @contextmanager
     def non_reentrant(self, contract_address: str):
@@ -38,20 +34,14 @@ class ReentrancyGuard:
         Args:
             contract_address: Address of the contract being protected
         """
-        lock = self._get_lock(contract_address)
-        
-        if self.is_locked(contract_address):
+        token = object()
+        if self._call_stack.setdefault(contract_address, token) is not token:
             raise ReentrancyError("Reentrancy detected")
         
-        lock.acquire()
         try:
-            self._call_stack[contract_address] = self._call_stack.get(contract_address, 0) + 1
             yield
         finally:
-            self._call_stack[contract_address] -= 1
-            if self._call_stack[contract_address] <= 0:
-                del self._call_stack[contract_address]
-            lock.release()
+            del self._call_stack[contract_address]
     
     def protect_function(self, func):
         """
@@ -6,7 +6,7 @@ integer overflow and underflow vulnerabilities.
 """
 
 import sys
-from typing import Union
+from typing import Dict, Union
 
 
 class SafeMath:
@@ -112,15 +112,11 @@ class SafeMath:
         if a == 0 or b == 0:
             return 0
             
-        # Check for overflow before multiplication
-        if a > 0 and b > 0 and a > max_value // b:
-            raise OverflowError(f"Multiplication overflow: {a} * {b}")
+        # Positive and mixed-sign products are range-checked after the
+        # multiplication below; Python ints never wrap, so pre-checks would
+        # only repeat that work as an extra division or multiplication.
         if a < 0 and b < 0 and a < min_value // b:
             raise OverflowError(f"Multiplication overflow: {a} * {b}")
-        if (a > 0 and b < 0) or (a < 0 and b > 0):
-            abs_result = abs(a) * abs(b)
-            if abs_result > max(abs(max_value), abs(min_value)):
-                raise OverflowError(f"Multiplication overflow: {a} * {b}")
                 
         result = a * b
         
@@ -212,14 +208,24 @@ class SafeMath:
         if a == 0:
             return 0
             
-        # Check for overflow
+        # Check for overflow using square-and-multiply: O(log b) multiplies.
+        # Once the running square exceeds max_value while exponent bits
+        # remain, it will be multiplied in and the result must overflow.
         if a > 1 and b > 0:
-            temp = 1
-            for _ in range(b):
-                temp *= a
-                if temp > max_value:
+            result = 1
+            base = a
+            exponent = b
+            while True:
+                if exponent & 1:
+                    result *= base
+                    if result > max_value:
+                        raise OverflowError(f"Exponentiation overflow: {a} ** {b}")
+                exponent >>= 1
+                if not exponent:
+                    return result
+                base *= base
+                if base > max_value:
                     raise OverflowError(f"Exponentiation overflow: {a} ** {b}")
-            return temp
             
         result = a ** b
         
@@ -286,33 +292,27 @@ class SafeMathContract:
         Returns:
             True if transfer was successful
         """
-        try:
-            # Check balances
-            if from_address not in self.balances:
-                return False
-                
-            # Safe subtraction
-            new_from_balance = SafeMath.sub(
-                self.balances[from_address], 
-                amount,
-                max_value=SafeMath.UINT256_MAX
-            )
-            
-            # Safe addition
-            new_to_balance = SafeMath.add(
-                self.balances.get(to_address, 0),
-                amount,
-                max_value=SafeMath.UINT256_MAX
-            )
-            
-            # Update balances
-            self.balances[from_address] = new_from_balance
-            self.balances[to_address] = new_to_balance
-            
-            return True
-            
-        except OverflowError:
+        if not isinstance(amount, int):
+            raise TypeError("Operands must be integers")
+            
+        balances = self.balances
+        new_from_balance = balances.get(from_address, 0) - amount
+        new_to_balance = balances.get(to_address, 0) + amount
+        
+        # Both balances are uint256: OR-ing them leaves bits above 255 set
+        # (or goes negative) if either one under- or overflowed, so a single
+        # test covers both operations. Every condition is evaluated without
+        # short-circuiting, so an unknown sender, insufficient funds and an
+        # overflow all do the same work before the transfer is rejected.
+        valid = (from_address in balances) & ((new_from_balance | new_to_balance) >> 256 == 0)
+        if not valid:
             return False
+            
+        # Update balances
+        balances[from_address] = new_from_balance
+        balances[to_address] = new_to_balance
+        
+        return True
     
     def mint(self, address: str, amount: int) -> bool:
         """
@@ -325,28 +325,20 @@ class SafeMathContract:
         Returns:
             True if minting was successful
         """
-        try:
-            # Safe addition for balance
-            new_balance = SafeMath.add(
-                self.balances.get(address, 0),
-                amount,
-                max_value=SafeMath.UINT256_MAX
-            )
-            
-            # Safe addition for total supply
-            new_total = SafeMath.add(
-                self.total_supply,
-                amount,
-                max_value=SafeMath.UINT256_MAX
-            )
-            
-            self.balances[address] = new_balance
-            self.total_supply = new_total
-            
-            return True
-            
-        except OverflowError:
+        if not isinstance(amount, int):
+            raise TypeError("Operands must be integers")
+            
+        new_balance = self.balances.get(address, 0) + amount
+        new_total = self.total_supply + amount
+        
+        # Single uint256 range test for both sums, as in transfer()
+        if (new_balance | new_total) >> 256:
             return False
+            
+        self.balances[address] = new_balance
+        self.total_supply = new_total
+        
+        return True
 
 
 # Example usage
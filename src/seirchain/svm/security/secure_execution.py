@@ -7,11 +7,198 @@ code safely within the SeirChain Virtual Machine.
 
 import ast
 import builtins
+import hashlib
+import multiprocessing
+import os
+import pickle
+import signal
 import sys
-from typing import Dict, Any, List, Optional
+import types
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Union
 import threading
 
 
+# Maximum number of distinct contract sources whose validation/bytecode is remembered
+_VALIDATION_CACHE_SIZE = 1024
+
+# Default budget for isolated contract execution, overridable per call
+SANDBOX_CPU_SECONDS = int(os.environ.get('SANDBOX_CPU_SEC', '30'))
+SANDBOX_MEMORY_MB = int(os.environ.get('SANDBOX_MEM_MB', '2048'))
+
+
+def _picklable_items(mapping: Dict[str, Any]) -> Dict[str, Any]:
+    """Keep only the entries that can be sent back over a pipe."""
+    result = {}
+    for key, value in mapping.items():
+        try:
+            pickle.dumps(value)
+        except Exception:
+            continue
+        result[key] = value
+    return result
+
+
+def _run_limited(env: 'SecureExecutionEnvironment', code: str, context: Dict[str, Any],
+                 cpu_seconds: int, memory_mb: int, timeout: float, conn) -> None:
+    """Child-process body of execute_contract_isolated."""
+    import resource
+    
+    resource.setrlimit(resource.RLIMIT_CPU, (cpu_seconds, cpu_seconds))
+    memory_bytes = memory_mb * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (memory_bytes, memory_bytes))
+    
+    def _on_alarm(signum, frame):
+        raise TimeoutError(f"Contract exceeded {timeout}s wall-clock limit")
+    
+    signal.signal(signal.SIGALRM, _on_alarm)
+    signal.setitimer(signal.ITIMER_REAL, timeout)
+    try:
+        result = env.execute_contract(code, context)
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+    
+    result.pop('globals', None)
+    if 'result' in result:
+        result['result'] = _picklable_items(result['result'])
+    conn.send(result)
+    conn.close()
+
+
+def _code_key(code: str) -> bytes:
+    """Short digest identifying a contract source in the per-code caches."""
+    return hashlib.blake2b(code.encode(), digest_size=16).digest()
+
+
+def _remember(cache: OrderedDict, key: bytes, value) -> None:
+    """Insert into an LRU cache, evicting the oldest entry past the size cap."""
+    cache[key] = value
+    if len(cache) > _VALIDATION_CACHE_SIZE:
+        cache.popitem(last=False)
+
+
+class _StopWalk(Exception):
+    """Raised to abort the AST walk once every requested verdict is settled."""
+
+
+class _ContractVisitor(ast.NodeVisitor):
+    """
+    Single AST pass producing both the sandbox safety and the determinism
+    verdicts. The walk stops as soon as every requested verdict has failed.
+    """
+    
+    BLOCKED_CALLS = frozenset({'exec', 'eval', '__import__'})
+    NONDETERMINISTIC_MODULES = frozenset({'random', 'time', 'datetime'})
+    
+    def __init__(self, blocked_modules=frozenset(), check_safety: bool = True,
+                 check_determinism: bool = True):
+        self.blocked_modules = blocked_modules
+        self.check_safety = check_safety
+        self.check_determinism = check_determinism
+        self.safe = True
+        self.deterministic = True
+    
+    def run(self, tree: ast.AST) -> None:
+        try:
+            self.visit(tree)
+        except _StopWalk:
+            pass
+    
+    def _stop_if_settled(self):
+        if ((not self.check_safety or not self.safe) and
+                (not self.check_determinism or not self.deterministic)):
+            raise _StopWalk
+    
+    def visit_Import(self, node: ast.Import):
+        # Every import is blocked by the sandbox
+        self.safe = False
+        for alias in node.names:
+            if alias.name in self.NONDETERMINISTIC_MODULES:
+                self.deterministic = False
+        self._stop_if_settled()
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        self.safe = False
+        if node.module in self.NONDETERMINISTIC_MODULES:
+            self.deterministic = False
+        self._stop_if_settled()
+    
+    def visit_Call(self, node: ast.Call):
+        # Block exec and eval
+        func = node.func
+        if type(func) is ast.Name and func.id in self.BLOCKED_CALLS:
+            self.safe = False
+            self._stop_if_settled()
+        self.generic_visit(node)
+    
+    def visit_Attribute(self, node: ast.Attribute):
+        # Block attribute access to dangerous modules
+        value = node.value
+        if type(value) is ast.Name and value.id in self.blocked_modules:
+            self.safe = False
+            self._stop_if_settled()
+        self.generic_visit(node)
+
+
+class _DeterminismTransformer(ast.NodeTransformer):
+    """
+    Strips non-deterministic modules from a contract AST: their imports, and
+    any statement that uses one of them as `module.attr`. Bodies left empty
+    get a `pass` so the result still compiles.
+    """
+    
+    _STMT_LIST_FIELDS = ('body', 'orelse', 'finalbody', 'handlers', 'cases')
+    _TRY_NODES = (ast.Try, ast.TryStar) if hasattr(ast, 'TryStar') else (ast.Try,)
+    
+    def _uses_nondeterministic(self, node: ast.AST) -> bool:
+        modules = _ContractVisitor.NONDETERMINISTIC_MODULES
+        return any(
+            isinstance(sub, ast.Attribute) and isinstance(sub.value, ast.Name)
+            and sub.value.id in modules
+            for sub in ast.walk(node)
+        )
+    
+    def visit(self, node: ast.AST):
+        if isinstance(node, ast.stmt):
+            # Only the statement's own expressions count; nested bodies are
+            # visited (and pruned) separately
+            for field, value in ast.iter_fields(node):
+                if field in self._STMT_LIST_FIELDS:
+                    continue
+                values = value if isinstance(value, list) else [value]
+                if any(isinstance(v, ast.AST) and self._uses_nondeterministic(v)
+                       for v in values):
+                    return None
+        node = super().visit(node)
+        if node is None:
+            return None
+        if isinstance(getattr(node, 'body', None), list) and not node.body:
+            node.body = [ast.Pass()]
+        if isinstance(node, self._TRY_NODES) and not node.handlers and not node.finalbody:
+            # A try needs an except or finally clause to compile
+            node.finalbody = [ast.Pass()]
+        elif isinstance(node, ast.Match) and not node.cases:
+            return None
+        return node
+    
+    def visit_match_case(self, node: ast.match_case):
+        if self._uses_nondeterministic(node.pattern) or (
+                node.guard is not None and self._uses_nondeterministic(node.guard)):
+            return None
+        return self.generic_visit(node)
+    
+    def visit_Import(self, node: ast.Import):
+        modules = _ContractVisitor.NONDETERMINISTIC_MODULES
+        node.names = [alias for alias in node.names
+                      if alias.name.partition('.')[0] not in modules]
+        return node if node.names else None
+    
+    def visit_ImportFrom(self, node: ast.ImportFrom):
+        if (node.module or '').partition('.')[0] in _ContractVisitor.NONDETERMINISTIC_MODULES:
+            return None
+        return node
+
+
 class SecureExecutionEnvironment:
     """
     Provides a sandboxed environment for executing smart contracts safely.
@@ -19,19 +206,31 @@ class SecureExecutionEnvironment:
     
     def __init__(self):
         """Initialize the secure execution environment."""
-        self.allowed_builtins = {
+        self.allowed_builtins = frozenset({
             'len', 'range', 'enumerate', 'zip', 'map', 'filter',
             'sum', 'min', 'max', 'abs', 'round', 'int', 'float', 'str',
             'bool', 'list', 'dict', 'set', 'tuple'
+        })
+        self._safe_builtins = {
+            name: getattr(builtins, name)
+            for name in self.allowed_builtins
+            if hasattr(builtins, name)
         }
         
-        self.blocked_modules = {
+        self.blocked_modules = frozenset({
             'os', 'sys', 'subprocess', 'socket', 'urllib', 'requests',
             'http', 'ftplib', 'smtplib', 'sqlite3', 'pickle', 'marshal'
-        }
+        })
         
         self.execution_context = threading.local()
         
+        # LRU of code digest -> validate_ast verdict
+        self._ast_cache: "OrderedDict[bytes, bool]" = OrderedDict()
+        # LRU of code digest -> compiled code object (immutable, safe to reuse)
+        self._code_cache: "OrderedDict[bytes, types.CodeType]" = OrderedDict()
+        # (contract_id, function name) -> callable from a registered contract
+        self._functions: Dict[tuple, Any] = {}
+        
     def create_safe_globals(self, custom_globals: Dict[str, Any] = None) -> Dict[str, Any]:
         """
         Create a safe global namespace for contract execution.
@@ -42,13 +241,9 @@ class SecureExecutionEnvironment:
         Returns:
             Safe global namespace dictionary
         """
-        safe_globals = {
-            '__builtins__': {
-                name: getattr(builtins, name) 
-                for name in self.allowed_builtins 
-                if hasattr(builtins, name)
-            }
-        }
+        # Contracts can reach __builtins__ by name, so each execution gets its
+        # own copy of the prebuilt table rather than the shared dict
+        safe_globals = {'__builtins__': self._safe_builtins.copy()}
         
         if custom_globals:
             safe_globals.update(custom_globals)
@@ -65,33 +260,97 @@ class SecureExecutionEnvironment:
         Returns:
             True if code is safe, False otherwise
         """
+        key = _code_key(code)
+        cache = self._ast_cache
+        verdict = cache.get(key)
+        if verdict is not None:
+            try:
+                cache.move_to_end(key)
+            except KeyError:
+                pass  # evicted by another thread since the get
+            return verdict
+        
         try:
-            tree = ast.parse(code)
-            
-            for node in ast.walk(tree):
-                # Block import statements
-                if isinstance(node, (ast.Import, ast.ImportFrom)):
-                    if isinstance(node, ast.ImportFrom):
-                        if node.module in self.blocked_modules:
-                            return False
-                    return False
-                
-                # Block exec and eval
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name):
-                        if node.func.id in ['exec', 'eval', '__import__']:
-                            return False
-                
-                # Block attribute access to dangerous modules
-                if isinstance(node, ast.Attribute):
-                    if isinstance(node.value, ast.Name):
-                        if node.value.id in self.blocked_modules:
-                            return False
+            verdict = self.validate_tree(ast.parse(code))
+        except SyntaxError:
+            verdict = False
+        _remember(cache, key, verdict)
+        return verdict
+    
+    def validate_tree(self, tree: ast.AST) -> bool:
+        """
+        Validate an already parsed contract AST for safety.
+        
+        Args:
+            tree: Parsed contract code
             
-            return True
+        Returns:
+            True if code is safe, False otherwise
+        """
+        visitor = _ContractVisitor(self.blocked_modules, check_determinism=False)
+        visitor.run(tree)
+        return visitor.safe
+    
+    def validate_contract(self, code: Union[str, ast.AST]) -> Dict[str, bool]:
+        """
+        Check sandbox safety and determinism with one parse and one AST walk.
+        
+        Args:
+            code: Python code to validate, or its parsed AST
             
+        Returns:
+            Dictionary with 'safe' and 'deterministic' verdicts
+        """
+        if isinstance(code, ast.AST):
+            tree = code
+        else:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                return {'safe': False, 'deterministic': False}
+        visitor = _ContractVisitor(self.blocked_modules)
+        visitor.run(tree)
+        return {'safe': visitor.safe, 'deterministic': visitor.deterministic}
+    
+    def _load(self, code: str) -> Optional[types.CodeType]:
+        """
+        Validate and compile contract code, parsing it at most once.
+        
+        Both the verdict and the code object are cached by source digest,
+        and compile() is handed the already validated tree instead of the
+        source text.
+        
+        Returns:
+            The code object, or None if the code is invalid or unsafe.
+            Errors that only surface at compile time (e.g. a top-level
+            return) propagate as SyntaxError.
+        """
+        key = _code_key(code)
+        compiled_code = self._code_cache.get(key)
+        if compiled_code is not None:
+            try:
+                self._code_cache.move_to_end(key)
+            except KeyError:
+                pass  # evicted by another thread since the get
+            return compiled_code
+        
+        verdict = self._ast_cache.get(key)
+        if verdict is False:
+            return None
+        try:
+            tree = ast.parse(code)
         except SyntaxError:
-            return False
+            _remember(self._ast_cache, key, False)
+            return None
+        if verdict is None:
+            verdict = self.validate_tree(tree)
+            _remember(self._ast_cache, key, verdict)
+            if not verdict:
+                return None
+        
+        compiled_code = compile(tree, '<smart_contract>', 'exec')
+        _remember(self._code_cache, key, compiled_code)
+        return compiled_code
     
     def execute_contract(self, code: str, context: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -104,15 +363,18 @@ class SecureExecutionEnvironment:
         Returns:
             Dictionary with execution results
         """
-        if not self.validate_ast(code):
+        try:
+            compiled_code = self._load(code)
+        except SyntaxError as e:
+            return {'success': False, 'error': str(e), 'type': type(e).__name__}
+        if compiled_code is None:
             return {'error': 'Invalid or unsafe code', 'success': False}
         
         safe_globals = self.create_safe_globals(context or {})
         safe_locals = {}
         
         try:
-            # Compile and execute in restricted environment
-            compiled_code = compile(code, '<smart_contract>', 'exec')
+            # Execute in restricted environment
             exec(compiled_code, safe_globals, safe_locals)
             
             return {
@@ -128,6 +390,62 @@ class SecureExecutionEnvironment:
                 'type': type(e).__name__
             }
     
+    def execute_contract_isolated(self, code: str, context: Dict[str, Any] = None,
+                                  cpu_seconds: int = None, memory_mb: int = None,
+                                  timeout: float = None) -> Dict[str, Any]:
+        """
+        Execute smart contract code in a forked child with CPU, memory and
+        wall-clock limits, so runaway loops or allocations cannot take the
+        node down.
+        
+        Args:
+            code: Python code to execute
+            context: Execution context variables
+            cpu_seconds: RLIMIT_CPU for the child (default SANDBOX_CPU_SEC)
+            memory_mb: RLIMIT_AS for the child in MiB (default SANDBOX_MEM_MB)
+            timeout: Wall-clock limit in seconds (default cpu_seconds)
+            
+        Returns:
+            Dictionary with execution results. Only picklable locals are
+            returned, and 'globals' is omitted.
+        """
+        # Reject unsafe code before paying for a fork
+        if not self.validate_ast(code):
+            return {'error': 'Invalid or unsafe code', 'success': False}
+        
+        cpu_seconds = cpu_seconds or SANDBOX_CPU_SECONDS
+        memory_mb = memory_mb or SANDBOX_MEMORY_MB
+        timeout = timeout or cpu_seconds
+        
+        ctx = multiprocessing.get_context('fork')
+        parent_conn, child_conn = ctx.Pipe(duplex=False)
+        process = ctx.Process(
+            target=_run_limited,
+            args=(self, code, context or {}, cpu_seconds, memory_mb, timeout, child_conn),
+            daemon=True
+        )
+        process.start()
+        child_conn.close()
+        
+        try:
+            # Grace period on top of the in-child alarm for result transfer
+            if parent_conn.poll(timeout + 1.0):
+                return parent_conn.recv()
+        except EOFError:
+            pass
+        finally:
+            if process.is_alive():
+                process.kill()
+            process.join()
+            parent_conn.close()
+        
+        return {
+            'success': False,
+            'error': 'Contract exceeded its resource limits',
+            'type': 'ResourceLimitExceeded',
+            'exitcode': process.exitcode
+        }
+    
     def execute_function(self, code: str, function_name: str, 
                         args: List[Any] = None, kwargs: Dict[str, Any] = None) -> Dict[str, Any]:
         """
@@ -142,7 +460,11 @@ class SecureExecutionEnvironment:
         Returns:
             Dictionary with execution results
         """
-        if not self.validate_ast(code):
+        try:
+            compiled_code = self._load(code)
+        except SyntaxError as e:
+            return {'success': False, 'error': str(e), 'type': type(e).__name__}
+        if compiled_code is None:
             return {'error': 'Invalid or unsafe code', 'success': False}
         
         safe_globals = self.create_safe_globals()
@@ -150,7 +472,6 @@ class SecureExecutionEnvironment:
         
         try:
             # Execute the code to define functions
-            compiled_code = compile(code, '<smart_contract>', 'exec')
             exec(compiled_code, safe_globals, safe_locals)
             
             # Check if function exists
@@ -177,6 +498,85 @@ class SecureExecutionEnvironment:
                 'error': str(e),
                 'type': type(e).__name__
             }
+    
+    def register_contract(self, contract_id: str, code: str) -> Dict[str, Any]:
+        """
+        Validate, compile and execute contract code once, keeping its
+        functions for direct dispatch through call_function.
+        
+        Unlike execute_function, which re-executes the code in a fresh
+        namespace per call, a registered contract keeps one namespace for
+        its lifetime. Registering the same contract_id again replaces it.
+        
+        Args:
+            contract_id: Identifier to register the contract under
+            code: Python code defining the contract's functions
+            
+        Returns:
+            Dictionary with the registered function names
+        """
+        try:
+            compiled_code = self._load(code)
+        except SyntaxError as e:
+            return {'success': False, 'error': str(e), 'type': type(e).__name__}
+        if compiled_code is None:
+            return {'error': 'Invalid or unsafe code', 'success': False}
+        
+        # Functions resolve module-level names through their globals, so
+        # the contract runs with a single namespace
+        namespace = self.create_safe_globals()
+        try:
+            exec(compiled_code, namespace)
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'type': type(e).__name__
+            }
+        
+        functions = {
+            (contract_id, name): value for name, value in namespace.items()
+            if name != '__builtins__' and isinstance(value, types.FunctionType)
+        }
+        # Swap in the new function set in as few dict operations as possible
+        stale = [key for key in self._functions if key[0] == contract_id and key not in functions]
+        self._functions.update(functions)
+        for key in stale:
+            self._functions.pop(key, None)
+        
+        return {'success': True, 'functions': sorted(name for _, name in functions)}
+    
+    def call_function(self, contract_id: str, function_name: str,
+                      args: List[Any] = None, kwargs: Dict[str, Any] = None) -> Dict[str, Any]:
+        """
+        Call a function of a registered contract: a dict lookup and a direct
+        call, with no validation, compile or exec per call.
+        
+        Args:
+            contract_id: Identifier the contract was registered under
+            function_name: Name of the function to execute
+            args: Positional arguments
+            kwargs: Keyword arguments
+            
+        Returns:
+            Dictionary with execution results
+        """
+        func = self._functions.get((contract_id, function_name))
+        if func is None:
+            return {'error': f'Function {function_name} not found', 'success': False}
+        
+        try:
+            result = func(*(args or ()), **(kwargs or {}))
+            return {
+                'success': True,
+                'result': result
+            }
+        except Exception as e:
+            return {
+                'success': False,
+                'error': str(e),
+                'type': type(e).__name__
+            }
 
 
 class DeterministicExecution:
@@ -193,74 +593,38 @@ class DeterministicExecution:
             code: Original Python code
             
         Returns:
-            Modified code with deterministic behavior
+            Modified code with deterministic behavior; code that does not
+            parse is returned unchanged
         """
-        # Remove non-deterministic imports and functions
-        lines = code.split('\n')
-        deterministic_lines = []
-        
-        for line in lines:
-            line = line.strip()
-            
-            # Remove random module usage
-            if 'import random' in line or 'from random' in line:
-                continue
-            
-            # Remove time module usage
-            if 'import time' in line or 'from time' in line:
-                continue
-            
-            # Remove datetime usage
-            if 'import datetime' in line or 'from datetime' in line:
-                continue
-            
-            # Remove direct usage of non-deterministic functions
-            if 'random.' in line or 'time.' in line or 'datetime.' in line:
-                continue
-                
-            deterministic_lines.append(line)
-        
-        return '\n'.join(deterministic_lines)
+        # Remove non-deterministic imports and the statements using them
+        try:
+            tree = ast.parse(code)
+        except SyntaxError:
+            return code
+        tree = ast.fix_missing_locations(_DeterminismTransformer().visit(tree))
+        return ast.unparse(tree)
     
     @staticmethod
-    def validate_deterministic(code: str) -> bool:
+    def validate_deterministic(code: Union[str, ast.AST]) -> bool:
         """
         Check if code is deterministic.
         
         Args:
-            code: Python code to check
+            code: Python code to check, or its parsed AST
             
         Returns:
             True if code is deterministic, False otherwise
         """
-        try:
-            tree = ast.parse(code)
-            
-            for node in ast.walk(tree):
-                # Check for random module usage
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name == 'random':
-                            return False
-                
-                if isinstance(node, ast.ImportFrom):
-                    if node.module == 'random':
-                        return False
-                
-                # Check for time module usage
-                if isinstance(node, ast.Import):
-                    for alias in node.names:
-                        if alias.name in ['time', 'datetime']:
-                            return False
-                
-                if isinstance(node, ast.ImportFrom):
-                    if node.module in ['time', 'datetime']:
-                        return False
-            
-            return True
-            
-        except SyntaxError:
-            return False
+        if isinstance(code, ast.AST):
+            tree = code
+        else:
+            try:
+                tree = ast.parse(code)
+            except SyntaxError:
+                return False
+        visitor = _ContractVisitor(check_safety=False)
+        visitor.run(tree)
+        return visitor.deterministic
 
 
 # Example usage
@@ -5,12 +5,21 @@ Implements a simple two-phase commit protocol for ensuring atomicity
 in cross-shard transactions between Triads in the SeirChain Virtual Machine.
 """
 
-import uuid
+import secrets
+import threading
 import time
-from typing import Dict, List, Any, Optional
+from collections import deque
+from typing import Deque, Dict, Iterator, List, Any, Optional, Tuple
 from enum import Enum
 from dataclasses import dataclass
 
+import numpy as np
+
+
+# Below this many participants comparing the drawn floats in Python beats
+# a vectorized comparison plus bool-array conversion
+_BATCH_DRAW_MIN_PARTICIPANTS = 32
+
 
 class TransactionStatus(Enum):
     """Status of a cross-shard transaction."""
@@ -23,7 +32,65 @@ class TransactionStatus(Enum):
     ABORTED = "aborted"
 
 
-@dataclass
+# Statuses after which a transaction no longer changes
+_FINAL_STATUSES = frozenset({TransactionStatus.COMMITTED, TransactionStatus.ABORTED})
+
+
+class ShardedDict:
+    """
+    Dictionary split into a power-of-two number of shards, each with its
+    own lock, so writers touching different keys do not contend.
+    
+    Single-key reads (get, in, []) take no lock; dict operations are atomic
+    under the GIL. Writers hold lock_for(key) around read-modify-write
+    sequences on that key.
+    """
+    
+    def __init__(self, num_shards: int = 16):
+        if num_shards <= 0 or num_shards & (num_shards - 1):
+            raise ValueError("num_shards must be a power of two")
+        self._mask = num_shards - 1
+        self._shards: List[Dict[Any, Any]] = [{} for _ in range(num_shards)]
+        self._locks = [threading.Lock() for _ in range(num_shards)]
+    
+    def _index(self, key) -> int:
+        return hash(key) & self._mask
+    
+    def lock_for(self, key) -> threading.Lock:
+        """The lock guarding key's shard."""
+        return self._locks[self._index(key)]
+    
+    def get(self, key, default=None):
+        return self._shards[self._index(key)].get(key, default)
+    
+    def pop(self, key, *default):
+        return self._shards[self._index(key)].pop(key, *default)
+    
+    def __getitem__(self, key):
+        return self._shards[self._index(key)][key]
+    
+    def __setitem__(self, key, value):
+        self._shards[self._index(key)][key] = value
+    
+    def __delitem__(self, key):
+        del self._shards[self._index(key)][key]
+    
+    def __contains__(self, key) -> bool:
+        return key in self._shards[self._index(key)]
+    
+    def __len__(self) -> int:
+        return sum(len(shard) for shard in self._shards)
+    
+    def __iter__(self) -> Iterator:
+        for shard in self._shards:
+            yield from list(shard)
+    
+    def items(self) -> Iterator[Tuple[Any, Any]]:
+        for shard in self._shards:
+            yield from list(shard.items())
+
+
+@dataclass(slots=True)
 class CrossShardTransaction:
     """Represents a cross-shard transaction."""
     tx_id: str
@@ -31,7 +98,7 @@ class CrossShardTransaction:
     operations: Dict[int, Any]  # triad_id -> operations
     status: TransactionStatus
     coordinator_triad: int
-    participants: Dict[int, bool]  # triad_id -> prepared status
+    participants: bytearray  # prepared flag (0/1) per position in triad_ids
     timestamp: float
 
 
@@ -40,13 +107,37 @@ class TwoPhaseCommit:
     Implements the two-phase commit protocol for cross-shard transactions.
     
     Ensures atomicity across multiple Triads in the SeirChain Virtual Machine.
+    
+    Status polling vastly outnumbers state changes, so reads take no lock:
+    each looks its transaction up with a single dict.get, which is atomic
+    under the GIL. Transactions live in a ShardedDict, and begin/prepare/
+    commit/abort/cleanup only lock the shard of the transaction they change,
+    so coordinators working on different transactions rarely contend.
     """
     
-    def __init__(self):
-        """Initialize the two-phase commit coordinator."""
-        self.transactions: Dict[str, CrossShardTransaction] = {}
+    def __init__(self, rng: Optional[np.random.Generator] = None):
+        """
+        Initialize the two-phase commit coordinator.
+        
+        Args:
+            rng: Generator for the simulated prepare outcomes; pass a seeded
+                one for reproducible runs
+        """
+        self.rng = rng if rng is not None else np.random.default_rng()
+        self.transactions = ShardedDict()
         self.pending_operations: Dict[str, Dict[int, Any]] = {}
+        # (finish time, tx_id) of committed/aborted transactions, oldest first.
+        # Appends are atomic; the cleanup lock keeps concurrent cleanups from
+        # racing between peeking at the head and popping it
+        self._terminal: Deque[Tuple[float, str]] = deque()
+        self._cleanup_lock = threading.Lock()
         
+    def _finish(self, transaction: CrossShardTransaction, status: TransactionStatus):
+        """Move a transaction to a final status, queueing it for cleanup once."""
+        if transaction.status not in _FINAL_STATUSES:
+            self._terminal.append((time.time(), transaction.tx_id))
+        transaction.status = status
+    
     def begin_cross_shard_transaction(self, triad_ids: List[int], 
                                     operations: Dict[int, Any],
                                     coordinator_triad: int = None) -> str:
@@ -61,20 +152,21 @@ class TwoPhaseCommit:
         Returns:
             Transaction ID
         """
-        tx_id = str(uuid.uuid4())
+        tx_id = secrets.token_hex(16)
         
         if coordinator_triad is None:
             coordinator_triad = triad_ids[0]
             
-        self.transactions[tx_id] = CrossShardTransaction(
+        transaction = CrossShardTransaction(
             tx_id=tx_id,
             triad_ids=triad_ids,
             operations=operations,
             status=TransactionStatus.INITIATED,
             coordinator_triad=coordinator_triad,
-            participants={triad_id: False for triad_id in triad_ids},
+            participants=bytearray(len(triad_ids)),
             timestamp=time.time()
         )
+        self.transactions[tx_id] = transaction
         
         return tx_id
     
@@ -88,31 +180,35 @@ class TwoPhaseCommit:
         Returns:
             Dictionary mapping triad IDs to their prepare status
         """
-        if tx_id not in self.transactions:
-            return {}
+        with self.transactions.lock_for(tx_id):
+            transaction = self.transactions.get(tx_id)
+            if transaction is None:
+                return {}
+                
+            transaction.status = TransactionStatus.PREPARING
             
-        transaction = self.transactions[tx_id]
-        transaction.status = TransactionStatus.PREPARING
-        
-        # Simulate preparing each participant
-        prepare_results = {}
-        for triad_id in transaction.triad_ids:
+            # Simulate preparing each participant
             # In a real implementation, this would involve network communication
             # For simulation, we'll randomly decide if preparation succeeds
-            import random
-            prepare_success = random.random() > 0.1  # 90% success rate
-            prepare_results[triad_id] = prepare_success
-            transaction.participants[triad_id] = prepare_success
-        
-        # Check if all participants prepared successfully
-        all_prepared = all(transaction.participants.values())
-        
-        if all_prepared:
-            transaction.status = TransactionStatus.PREPARED
-        else:
-            transaction.status = TransactionStatus.ABORTING
+            triad_ids = transaction.triad_ids
+            # 90% success rate; both paths consume the same draws from self.rng
+            samples = self.rng.random(len(triad_ids))
+            if len(triad_ids) >= _BATCH_DRAW_MIN_PARTICIPANTS:
+                draws = (samples > 0.1).tolist()
+            else:
+                draws = [sample > 0.1 for sample in samples.tolist()]
+            prepare_results = dict(zip(triad_ids, draws))
+            transaction.participants[:] = bytes(draws)
+            
+            # Check if all participants prepared successfully
+            all_prepared = all(transaction.participants)
             
-        return prepare_results
+            if all_prepared:
+                transaction.status = TransactionStatus.PREPARED
+            else:
+                transaction.status = TransactionStatus.ABORTING
+                
+            return prepare_results
     
     def commit_phase(self, tx_id: str) -> bool:
         """
@@ -124,33 +220,29 @@ class TwoPhaseCommit:
         Returns:
             True if commit was successful, False otherwise
         """
-        if tx_id not in self.transactions:
-            return False
+        with self.transactions.lock_for(tx_id):
+            transaction = self.transactions.get(tx_id)
+            if transaction is None:
+                return False
             
-        transaction = self.transactions[tx_id]
-        
-        if transaction.status != TransactionStatus.PREPARED:
-            return False
+            if transaction.status != TransactionStatus.PREPARED:
+                return False
+                
+            transaction.status = TransactionStatus.COMMITTING
             
-        transaction.status = TransactionStatus.COMMITTING
-        
-        # Simulate committing each participant
-        commit_success = True
-        for triad_id in transaction.triad_ids:
+            # Simulate committing each participant
             # In a real implementation, this would involve network communication
             # For simulation, we'll assume commit succeeds if prepared
-            if not transaction.participants[triad_id]:
-                commit_success = False
-                break
-        
-        if commit_success:
-            transaction.status = TransactionStatus.COMMITTED
-            # Apply the actual operations here
-            self._apply_operations(transaction)
-        else:
-            transaction.status = TransactionStatus.ABORTED
+            commit_success = all(transaction.participants)
             
-        return commit_success
+            if commit_success:
+                self._finish(transaction, TransactionStatus.COMMITTED)
+                # Apply the actual operations here
+                self._apply_operations(transaction)
+            else:
+                self._finish(transaction, TransactionStatus.ABORTED)
+                
+            return commit_success
     
     def abort_transaction(self, tx_id: str) -> bool:
         """
@@ -162,19 +254,21 @@ class TwoPhaseCommit:
         Returns:
             True if abort was successful
         """
-        if tx_id not in self.transactions:
-            return False
+        with self.transactions.lock_for(tx_id):
+            transaction = self.transactions.get(tx_id)
+            if transaction is None:
+                return False
+                
+            if transaction.status not in _FINAL_STATUSES:
+                transaction.status = TransactionStatus.ABORTING
             
-        transaction = self.transactions[tx_id]
-        transaction.status = TransactionStatus.ABORTING
-        
-        # Simulate aborting each participant
-        for triad_id in transaction.triad_ids:
-            # In a real implementation, this would involve network communication
-            pass
-            
-        transaction.status = TransactionStatus.ABORTED
-        return True
+            # Simulate aborting each participant
+            for triad_id in transaction.triad_ids:
+                # In a real implementation, this would involve network communication
+                pass
+                
+            self._finish(transaction, TransactionStatus.ABORTED)
+            return True
     
     def _apply_operations(self, transaction: CrossShardTransaction):
         """
@@ -198,9 +292,8 @@ class TwoPhaseCommit:
         Returns:
             Current transaction status or None if not found
         """
-        if tx_id not in self.transactions:
-            return None
-        return self.transactions[tx_id].status
+        transaction = self.transactions.get(tx_id)
+        return transaction.status if transaction else None
     
     def get_transaction_info(self, tx_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -212,16 +305,19 @@ class TwoPhaseCommit:
         Returns:
             Dictionary with transaction information
         """
-        if tx_id not in self.transactions:
+        transaction = self.transactions.get(tx_id)
+        if transaction is None:
             return None
             
-        transaction = self.transactions[tx_id]
         return {
             'tx_id': transaction.tx_id,
             'triad_ids': transaction.triad_ids,
             'status': transaction.status.value,
             'coordinator_triad': transaction.coordinator_triad,
-            'participants': transaction.participants,
+            'participants': {
+                triad_id: bool(prepared)
+                for triad_id, prepared in zip(transaction.triad_ids, transaction.participants)
+            },
             'timestamp': transaction.timestamp
         }
     
@@ -229,19 +325,21 @@ class TwoPhaseCommit:
         """
         Clean up old completed transactions.
         
+        Only transactions that finished more than max_age ago are visited,
+        by popping the age-ordered queue of finished transactions; in-flight
+        ones are never scanned.
+        
         Args:
             max_age: Maximum age in seconds before cleanup
         """
-        current_time = time.time()
-        to_remove = []
-        
-        for tx_id, transaction in self.transactions.items():
-            if transaction.status in [TransactionStatus.COMMITTED, TransactionStatus.ABORTED]:
-                if current_time - transaction.timestamp > max_age:
-                    to_remove.append(tx_id)
+        cutoff = time.time() - max_age
         
-        for tx_id in to_remove:
-            del self.transactions[tx_id]
+        with self._cleanup_lock:
+            terminal = self._terminal
+            while terminal and terminal[0][0] < cutoff:
+                _, tx_id = terminal.popleft()
+                with self.transactions.lock_for(tx_id):
+                    self.transactions.pop(tx_id, None)
 
 
 class CrossShardCoordinator:
@@ -6,9 +6,111 @@ smart contract and account addresses to specific Triad IDs (shards).
 """
 
 import hashlib
-from typing import Tuple, Dict, Any
+import threading
+from collections import OrderedDict
+from typing import Iterable, List, Tuple, Dict, Any, Union
+
+import numpy as np
+
+from seirchain.crypto.sha256 import sha256_batch
 from seirchain.structures.triad import Triad
 
+# Upper bound on cached address -> triad ID mappings; least recently used go first
+SHARD_MAPPING_CACHE_SIZE = 65536
+# The cache is split into this many independently locked LRU shards (power of two)
+_CACHE_SHARDS = 16
+
+_MASK64 = (1 << 64) - 1
+# SplitMix64 increment (golden ratio); successive states of a stream differ by it
+_GOLDEN64 = 0x9E3779B97F4A7C15
+
+
+def _mix64(z: int) -> int:
+    """SplitMix64 output function on a 64-bit state."""
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return z ^ (z >> 31)
+
+
+def _mix64_array(z: np.ndarray) -> np.ndarray:
+    """Vectorized _mix64; uint64 arithmetic wraps like the masked version."""
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def _stream(seed: int, i: int) -> int:
+    """i-th output of the SplitMix64 stream starting at seed."""
+    return _mix64((seed + i * _GOLDEN64) & _MASK64)
+
+
+def jump_back_hash(key: int, num_buckets: int) -> int:
+    """
+    Consistent hash of a 64-bit key into [0, num_buckets) (Ertl's JumpBackHash).
+    
+    A key's bucket is the largest "jump" point below num_buckets, where bucket
+    j >= 1 is a jump point with probability 1/(j+1). Growing num_buckets from
+    n to n+1 therefore moves only the keys that jump to n, i.e. 1/(n+1) of them.
+    Each range [2^q, 2^(q+1)) holds a jump with probability exactly 1/2, and its
+    largest jump is uniform over the range, so the walk goes from the top range
+    down and needs O(1) random draws on average. Every range draws from its own
+    SplitMix64 stream so the result for a range never depends on num_buckets.
+    """
+    if num_buckets <= 1:
+        return 0
+    top = (num_buckets - 1).bit_length() - 1
+    ranges = _stream(key, 1) & ((2 << top) - 1)
+    while ranges:
+        q = ranges.bit_length() - 1
+        low = 1 << q
+        seed = _stream(key, q + 2)
+        candidate = low + (_stream(seed, 1) & (low - 1))
+        i = 2
+        # Only the top range can reach past num_buckets: step down to the next
+        # jump in [low, candidate), which exists with probability 1 - low/candidate
+        while candidate >= num_buckets:
+            step = _stream(seed, i) % candidate
+            if step < low:
+                break
+            candidate = step
+            i += 1
+        else:
+            return candidate
+        ranges ^= low
+    return 0
+
+
+def jump_back_hash_array(keys: np.ndarray, num_buckets: int) -> np.ndarray:
+    """Vectorized jump_back_hash over a uint64 key array; returns int64 buckets."""
+    buckets = np.zeros(len(keys), dtype=np.int64)
+    if num_buckets <= 1 or len(keys) == 0:
+        return buckets
+    golden = np.uint64(_GOLDEN64)
+    top = (num_buckets - 1).bit_length() - 1
+    ranges = _mix64_array(keys + golden) & np.uint64((2 << top) - 1)
+    unresolved = np.ones(len(keys), dtype=bool)
+    for q in range(top, -1, -1):
+        low = 1 << q
+        active = np.flatnonzero(unresolved & ((ranges >> np.uint64(q)) & np.uint64(1)).astype(bool))
+        if not len(active):
+            continue
+        seed = _mix64_array(keys[active] + np.uint64((q + 2) * _GOLDEN64 & _MASK64))
+        candidate = np.uint64(low) + (_mix64_array(seed + golden) & np.uint64(low - 1))
+        found = np.ones(len(active), dtype=bool)
+        i = 2
+        pending = np.flatnonzero(candidate >= num_buckets)
+        while len(pending):
+            step = _mix64_array(seed[pending] + np.uint64(i * _GOLDEN64 & _MASK64)) % candidate[pending]
+            stays = step >= low
+            candidate[pending[stays]] = step[stays]
+            found[pending[~stays]] = False
+            pending = pending[stays & (step >= num_buckets)]
+            i += 1
+        hits = active[found]
+        buckets[hits] = candidate[found]
+        unresolved[hits] = False
+    return buckets
+
 
 class TriadSharding:
     """
@@ -18,27 +120,76 @@ class TriadSharding:
     ensuring consistent shard assignment across the network.
     """
     
-    def __init__(self, num_triads: int = 1024):
+    def __init__(self, num_triads: int = 1024, cache_size: int = SHARD_MAPPING_CACHE_SIZE):
         """
         Initialize the sharding system.
         
         Args:
             num_triads: Total number of triads (shards) in the system
+            cache_size: Maximum number of cached address mappings
         """
         self.num_triads = num_triads
-        self.shard_mapping: Dict[str, int] = {}
+        self.cache_size = cache_size
+        # Each shard is an LRU of at most cache_size / _CACHE_SHARDS entries.
+        # Lookups take no lock; inserts and evictions hold the shard's lock.
+        self._shard_capacity = max(1, cache_size // _CACHE_SHARDS)
+        self._cache_shards: "List[OrderedDict[str, int]]" = [
+            OrderedDict() for _ in range(_CACHE_SHARDS)
+        ]
+        self._cache_locks = [threading.Lock() for _ in range(_CACHE_SHARDS)]
+    
+    @property
+    def shard_mapping(self) -> Dict[str, int]:
+        """Snapshot of the cached address -> triad ID mappings."""
+        mapping: Dict[str, int] = {}
+        for shard in self._cache_shards:
+            mapping.update(shard.copy())
+        return mapping
         
-    def _hash_address(self, address: str) -> str:
+    def _hash_address(self, address: Union[str, bytes]) -> bytes:
         """
         Create a deterministic hash for an address.
         
         Args:
-            address: Smart contract or account address
+            address: Smart contract or account address, as text or bytes
+            
+        Returns:
+            Raw 32-byte SHA-256 digest
+        """
+        if isinstance(address, str):
+            address = address.encode()
+        return hashlib.sha256(address).digest()
+    
+    def _address_key(self, address: Union[str, bytes]) -> int:
+        """
+        First 8 bytes of the address hash as an integer, read straight from
+        the raw digest (same value as parsing the first 16 hex digits).
+        """
+        return int.from_bytes(self._hash_address(address)[:8], 'big')
+    
+    def _address_keys(self, addresses: Iterable[Union[str, bytes]]) -> np.ndarray:
+        """
+        Batched _address_key: hashes every address in one sha256_batch call
+        and reinterprets the 8-byte prefixes as a uint64 array.
+        """
+        digests = sha256_batch([
+            address.encode() if isinstance(address, str) else address
+            for address in addresses
+        ])
+        prefixes = b''.join([digest[:8] for digest in digests])
+        return np.frombuffer(prefixes, dtype='>u8').astype(np.uint64)
+    
+    def get_triad_ids(self, addresses: Iterable[Union[str, bytes]]) -> np.ndarray:
+        """
+        Determine the Triad IDs for many addresses at once.
+        
+        Args:
+            addresses: Smart contract or account addresses, as text or bytes
             
         Returns:
-            SHA-256 hash as hexadecimal string
+            Array of triad IDs, in input order
         """
-        return hashlib.sha256(address.encode()).hexdigest()
+        return jump_back_hash_array(self._address_keys(addresses), self.num_triads)
     
     def get_triad_id(self, address: str) -> int:
         """
@@ -50,22 +201,76 @@ class TriadSharding:
         Returns:
             Triad ID (shard number) between 0 and num_triads-1
         """
-        if address in self.shard_mapping:
-            return self.shard_mapping[address]
+        index = hash(address) & (_CACHE_SHARDS - 1)
+        shard = self._cache_shards[index]
+        triad_id = shard.get(address)
+        if triad_id is not None:
+            try:
+                shard.move_to_end(address)
+            except KeyError:
+                pass  # evicted by another thread since the get
+            return triad_id
             
-        # Create deterministic hash
-        hash_hex = self._hash_address(address)
+        key = self._address_key(address)
+        with self._cache_locks[index]:
+            # num_triads is read under the shard lock: resize() updates it
+            # before rebucketing each shard under the same lock, so an id
+            # computed here can never be cached for a stale bucket count
+            triad_id = jump_back_hash(key, self.num_triads)
+            # Cache the mapping, evicting the least recently used one past the cap
+            shard[address] = triad_id
+            if len(shard) > self._shard_capacity:
+                shard.popitem(last=False)
         
-        # Convert first 8 bytes of hash to integer
-        hash_int = int(hash_hex[:16], 16)
+        return triad_id
+    
+    def get_triad_id_bytes(self, address: bytes) -> int:
+        """
+        Determine the Triad ID of an address that is already encoded.
+        
+        Skips the str encode and the mapping cache: hashing raw bytes such as
+        a public key is cheaper than the cache bookkeeping. Gives the same
+        result as get_triad_id(address.decode()).
         
-        # Map to triad ID using modulo
-        triad_id = hash_int % self.num_triads
+        Args:
+            address: Smart contract or account address as bytes
+            
+        Returns:
+            Triad ID (shard number) between 0 and num_triads-1
+        """
+        return jump_back_hash(
+            int.from_bytes(hashlib.sha256(address).digest()[:8], 'big'), self.num_triads
+        )
+    
+    def resize(self, new_num_triads: int) -> list:
+        """
+        Change the number of triads, keeping the cached mappings consistent.
         
-        # Cache the mapping
-        self.shard_mapping[address] = triad_id
+        Thanks to jump_back_hash only about |new - old| / max(new, old) of the
+        addresses change triad, so this is also the set that has to migrate.
         
-        return triad_id
+        Args:
+            new_num_triads: New total number of triads
+            
+        Returns:
+            Cached addresses whose triad ID changed
+        """
+        if new_num_triads < 1:
+            raise ValueError("num_triads must be positive")
+        self.num_triads = new_num_triads
+        moved = []
+        for shard, lock in zip(self._cache_shards, self._cache_locks):
+            with lock:
+                addresses = list(shard)
+                if not addresses:
+                    continue
+                new_ids = self.get_triad_ids(addresses).tolist()
+                moved.extend(
+                    address for address, triad_id in zip(addresses, new_ids)
+                    if shard[address] != triad_id
+                )
+                shard.update(zip(addresses, new_ids))
+        return moved
     
     def get_shard_range(self, triad_id: int) -> Tuple[int, int]:
         """
@@ -107,7 +312,10 @@ class TriadSharding:
         Returns:
             List of addresses that belong to the specified triad
         """
-        return [addr for addr in addresses if self.get_triad_id(addr) == triad_id]
+        if len(addresses) == 0:
+            return []
+        matches = np.flatnonzero(self.get_triad_ids(addresses) == triad_id)
+        return [addresses[i] for i in matches.tolist()]
     
     def get_shard_distribution(self, addresses: list) -> Dict[int, int]:
         """
@@ -119,11 +327,21 @@ class TriadSharding:
         Returns:
             Dictionary mapping triad IDs to count of addresses
         """
-        distribution = {}
-        for address in addresses:
-            triad_id = self.get_triad_id(address)
-            distribution[triad_id] = distribution.get(triad_id, 0) + 1
-        return distribution
+        counts = self.get_shard_distribution_array(addresses)
+        occupied = np.flatnonzero(counts)
+        return dict(zip(occupied.tolist(), counts[occupied].tolist()))
+    
+    def get_shard_distribution_array(self, addresses: list) -> np.ndarray:
+        """
+        Get the distribution of addresses across shards as a dense array.
+        
+        Args:
+            addresses: List of addresses to analyze
+            
+        Returns:
+            Array of length num_triads with the address count per triad ID
+        """
+        return np.bincount(self.get_triad_ids(addresses), minlength=self.num_triads)
 
 
 class FractalSharding(TriadSharding):
@@ -141,6 +359,8 @@ class FractalSharding(TriadSharding):
         """
         super().__init__(num_triads=3**max_depth)
         self.max_depth = max_depth
+        # Place values of the ternary digits, most significant first
+        self._ternary_place_values = 3 ** np.arange(max_depth - 1, -1, -1, dtype=np.int64)
         
     def get_fractal_coordinates(self, address: str) -> Tuple[int, ...]:
         """
@@ -164,6 +384,21 @@ class FractalSharding(TriadSharding):
             
         return tuple(reversed(coordinates))
     
+    def get_fractal_coordinates_batch(self, addresses: Iterable[str]) -> np.ndarray:
+        """
+        Get the fractal coordinates for many addresses at once.
+        
+        Args:
+            addresses: The addresses to map
+            
+        Returns:
+            uint8 array of shape (len(addresses), max_depth); row i holds the
+            same digits get_fractal_coordinates returns for address i
+        """
+        triad_ids = self.get_triad_ids(addresses)
+        digits = (triad_ids[:, None] // self._ternary_place_values) % 3
+        return digits.astype(np.uint8)
+    
     def get_parent_triad(self, triad_id: int) -> int:
         """
         Get the parent triad ID in the fractal hierarchy.
@@ -2,6 +2,7 @@
 This module implements the WAC token, the native cryptocurrency of the SeirChain network.
 """
 
+import math
 import time
 
 class WACToken:
@@ -13,6 +14,8 @@ class WACToken:
         self.balances = {genesis_triad_address: initial_supply}
         self.staked = {}
         self.genesis_time = time.time()
+        self._halving_periods = None
+        self._inflation_rate = None
 
     def issue_initial_supply(self, supply, address):
         """
@@ -53,8 +56,11 @@ class WACToken:
         """
         years_since_genesis = (time.time() - self.genesis_time) / (365 * 24 * 60 * 60)
         halving_periods = int(years_since_genesis / 4)
-        inflation_rate = 0.05 / (2 ** halving_periods)
-        return inflation_rate
+        # The rate only changes once per halving period, so reuse it until then
+        if halving_periods != self._halving_periods:
+            self._halving_periods = halving_periods
+            self._inflation_rate = math.ldexp(0.05, -halving_periods)
+        return self._inflation_rate
 
     def apply_inflation(self):
         """
@@ -76,9 +82,9 @@ class WACToken:
         Returns:
             The cost of the votes.
         """
-        if self.balances.get(user, 0) < votes ** 2:
+        cost = votes * votes
+        if self.balances.get(user, 0) < cost:
             raise ValueError("Insufficient funds for quadratic voting.")
 
-        cost = votes ** 2
         self.balances[user] -= cost
         return cost
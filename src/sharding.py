@@ -1,17 +1,43 @@
 import hashlib
+from typing import Iterable, List, Union
 
-def get_triad_id(address: str, num_triads: int) -> int:
+def get_triad_id(address: Union[str, bytes], num_triads: int) -> int:
     """
     Assigns a smart contract or account address to a specific Triad ID.
 
     Args:
-        address: The address of the smart contract or account.
+        address: The address of the smart contract or account, either as
+            text or already encoded to bytes.
         num_triads: The total number of Triads.
 
     Returns:
         The Triad ID.
     """
-    hash_object = hashlib.sha256(address.encode())
-    hash_digest = hash_object.hexdigest()
-    hash_int = int(hash_digest, 16)
+    if isinstance(address, str):
+        address = address.encode()
+    # The leading 8 bytes of the digest are plenty of entropy for any
+    # realistic Triad count and keep the modulo on a machine-word integer.
+    hash_digest = hashlib.sha256(address).digest()
+    hash_int = int.from_bytes(hash_digest[:8], 'big')
     return hash_int % num_triads
+
+def get_triad_ids(addresses: Iterable[Union[str, bytes]], num_triads: int) -> List[int]:
+    """
+    Assigns a batch of addresses to Triad IDs.
+
+    Equivalent to calling get_triad_id for each address, but keeps the
+    loop in a single frame.
+
+    Args:
+        addresses: The addresses of the smart contracts or accounts, as
+            text or bytes.
+        num_triads: The total number of Triads.
+
+    Returns:
+        The Triad IDs, in the same order as the addresses.
+    """
+    sha256 = hashlib.sha256
+    from_bytes = int.from_bytes
+    return [from_bytes(sha256(address.encode() if isinstance(address, str) else address)
+                       .digest()[:8], 'big') % num_triads
+            for address in addresses]
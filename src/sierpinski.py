@@ -1,8 +1,5 @@
 import matplotlib.pyplot as plt
-import random
-
-def get_mid(p1, p2):
-    return ((p1[0] + p2[0]) / 2, (p1[1] + p2[1]) / 2)
+import numpy as np
 
 def sierpinski(n):
     """
@@ -10,29 +7,34 @@ def sierpinski(n):
     n: number of points to plot.
     """
     # Vertices of the triangle
-    vertices = [(0, 0), (1, 0), (0.5, 3**0.5 / 2)]
-
-    # Starting point
-    x, y = (0, 0)
-
-    # Lists to store the coordinates of the points
-    x_coords = [x]
-    y_coords = [y]
-
-    for _ in range(n):
-        # Choose a random vertex
-        chosen_vertex = random.choice(vertices)
-
-        # Get the midpoint
-        x, y = get_mid((x, y), chosen_vertex)
-
-        # Add the new point to the lists
-        x_coords.append(x)
-        y_coords.append(y)
+    vertices = np.array([(0, 0), (1, 0), (0.5, 3**0.5 / 2)])
+
+    # Choose all random vertices up front
+    chosen_vertices = vertices[np.random.randint(0, 3, size=n)]
+
+    # Starting from (0, 0), the k-th point is
+    #   p_k = sum_{i<=k} 2^-(k-i+1) * v_i
+    # so the whole walk is a convolution with a geometric kernel. Terms
+    # older than 53 steps are below double precision and are dropped.
+    kernel = 0.5 ** np.arange(1, 54)
+    x_coords = np.empty(n + 1)
+    y_coords = np.empty(n + 1)
+    x_coords[0] = y_coords[0] = 0.0
+    if n:
+        # np.convolve rejects an empty input
+        x_coords[1:] = np.convolve(chosen_vertices[:, 0], kernel)[:n]
+        y_coords[1:] = np.convolve(chosen_vertices[:, 1], kernel)[:n]
+
+    # Bin the points into a fixed-size raster; memory and render time no
+    # longer grow with n the way one scatter marker per point does
+    height = 3**0.5 / 2
+    counts, _, _ = np.histogram2d(x_coords, y_coords, bins=(1024, 1024),
+                                  range=[[0, 1], [0, height]])
 
     # Plot the points
     plt.figure(figsize=(8, 8))
-    plt.scatter(x_coords, y_coords, s=1)
+    plt.imshow(np.log1p(counts).T, origin="lower", extent=(0, 1, 0, height),
+               cmap="magma", interpolation="nearest")
     plt.title("Sierpinski Triangle")
     plt.axis("off")
     plt.savefig("sierpinski_triangle.png")
@@ -1,6 +1,9 @@
 import matplotlib.pyplot as plt
 import numpy as np
 
+# Upper bound on the points drawn per curve; Agg rendering is linear in points
+MAX_PLOT_POINTS = 10000
+
 def linear_storage(n):
   """
   Calculates the storage requirement for a linear blockchain.
@@ -16,8 +19,11 @@ def fractal_storage(n):
   return np.log(n)
 
 if __name__ == '__main__':
-  # Number of transactions
-  transactions = np.arange(1, 10000)
+  # Number of transactions; only every step-th point is evaluated and drawn,
+  # so larger ranges cost no more than MAX_PLOT_POINTS points
+  max_transactions = 10000
+  step = max(1, max_transactions // MAX_PLOT_POINTS)
+  transactions = np.arange(1, max_transactions, step)
 
   # Calculate storage for both models
   linear = linear_storage(transactions)
@@ -25,8 +31,8 @@ if __name__ == '__main__':
 
   # Plot the results
   plt.figure(figsize=(10, 6))
-  plt.plot(transactions, linear, label="Linear Blockchain")
-  plt.plot(transactions, fractal, label="SeirChain (Fractal)")
+  plt.plot(transactions, linear, label="Linear Blockchain", rasterized=step > 1)
+  plt.plot(transactions, fractal, label="SeirChain (Fractal)", rasterized=step > 1)
   plt.xlabel("Number of Transactions")
   plt.ylabel("Storage Requirements (Arbitrary Units)")
   plt.title("Storage Requirements: Linear vs. Fractal Blockchain")
@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class TernaryNode:
     def __init__(self, data):
         self.data = data
@@ -8,13 +11,90 @@ class TernaryNode:
 def print_tree(node, level=0, prefix="Root:"):
     """
     Prints the ternary tree structure.
+
+    Walks with an explicit stack, so deep trees do not hit the recursion limit.
     """
-    if node is not None:
+    stack = [(node, level, prefix)]
+    while stack:
+        node, level, prefix = stack.pop()
+        if node is None:
+            continue
         print(" " * (level*4) + prefix, node.data)
-        if node.left or node.middle or node.right:
-            print_tree(node.left, level + 1, "L---")
-            print_tree(node.middle, level + 1, "M---")
-            print_tree(node.right, level + 1, "R---")
+        stack.extend([(node.right, level + 1, "R---"), (node.middle, level + 1, "M---"),
+                      (node.left, level + 1, "L---")])
+
+class TernaryForest:
+    """
+    Ternary trees stored as arrays instead of linked nodes.
+
+    Node i keeps its payload in data[i] and the indices of its left, middle
+    and right children in children[i, 0..2] (-1 where there is no child), so
+    walks are integer loops over one contiguous array.
+    """
+
+    PREFIXES = ("L---", "M---", "R---")
+
+    def __init__(self, capacity=16):
+        if capacity < 1:
+            raise ValueError("capacity must be at least 1")
+        self.children = np.full((capacity, 3), -1, dtype=np.int32)
+        self.data = np.empty(capacity, dtype=object)
+        self.size = 0
+
+    def add_node(self, data, parent=-1, position=0):
+        """
+        Adds a node and returns its index.
+
+        position is 0, 1 or 2 for the left, middle or right child of parent;
+        a parent of -1 starts a new tree.
+        """
+        if self.size == len(self.data):
+            capacity = 2 * len(self.data)
+            children = np.full((capacity, 3), -1, dtype=np.int32)
+            children[:self.size] = self.children
+            payloads = np.empty(capacity, dtype=object)
+            payloads[:self.size] = self.data
+            self.children, self.data = children, payloads
+        index = self.size
+        self.data[index] = data
+        self.size += 1
+        if parent >= 0:
+            self.children[parent, position] = index
+        return index
+
+    @classmethod
+    def from_node(cls, root):
+        """
+        Converts a TernaryNode tree; the root ends up at index 0.
+        """
+        forest = cls()
+        if root is None:
+            return forest
+        stack = [(root, -1, 0)]
+        while stack:
+            node, parent, position = stack.pop()
+            index = forest.add_node(node.data, parent, position)
+            for child_position, child in ((2, node.right), (1, node.middle), (0, node.left)):
+                if child is not None:
+                    stack.append((child, index, child_position))
+        return forest
+
+    def print_tree(self, root=0):
+        """
+        Prints the tree rooted at index root, in the same format as print_tree.
+        """
+        if root >= self.size:
+            return
+        children = self.children.tolist()
+        data = self.data
+        stack = [(root, 0, "Root:")]
+        while stack:
+            index, level, prefix = stack.pop()
+            print(" " * (level*4) + prefix, data[index])
+            for position in (2, 1, 0):
+                child = children[index][position]
+                if child >= 0:
+                    stack.append((child, level + 1, self.PREFIXES[position]))
 
 if __name__ == '__main__':
     # Example of building a ternary tree representing a Triad Matrix
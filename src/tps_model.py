@@ -1,7 +1,18 @@
+import sys
+
+import numpy as np
+
+# One output line of the conflict-rate sweep
+SWEEP_LINE = "Conflict Rate (C_r): {:.2f} -> Max TPS: {:,.0f}\n"
+
+
 def calculate_max_tps(N, P, C_r):
     """
     Calculates the theoretical maximum TPS of a sharded blockchain.
 
+    Arguments may be scalars or NumPy arrays; arrays broadcast, so a whole
+    parameter grid is evaluated in one call.
+
     Args:
         N: The number of shards (Triads).
         P: The processing power of a single shard (in TPS).
@@ -12,6 +23,23 @@ def calculate_max_tps(N, P, C_r):
     """
     return N * P * (1 - C_r)
 
+
+def calculate_tps_grid(N_values, P, C_r_values):
+    """
+    Evaluates calculate_max_tps over every (N, C_r) pair.
+
+    Args:
+        N_values: The shard counts to sweep.
+        P: The processing power of a single shard (in TPS).
+        C_r_values: The cross-shard conflict rates to sweep.
+
+    Returns:
+        An array of shape (len(N_values), len(C_r_values)) with rows indexed
+        by N, ready for e.g. matplotlib's pcolormesh.
+    """
+    N_grid, C_r_grid = np.meshgrid(np.asarray(N_values), np.asarray(C_r_values), indexing='ij')
+    return calculate_max_tps(N_grid, P, C_r_grid)
+
 if __name__ == "__main__":
     N = 64  # Number of Triads
     P = 1000  # Processing power of a single Triad (TPS)
@@ -19,6 +47,18 @@ if __name__ == "__main__":
     print(f"Modeling TPS with N={N} and P={P}")
     print("-" * 30)
 
-    for C_r in [0.01, 0.05, 0.1, 0.2, 0.5]:
-        max_tps = calculate_max_tps(N, P, C_r)
-        print(f"Conflict Rate (C_r): {C_r:.2f} -> Max TPS: {max_tps:,.0f}")
+    conflict_rates = np.array([0.01, 0.05, 0.1, 0.2, 0.5])
+    max_tps = calculate_max_tps(N, P, conflict_rates)
+    sys.stdout.write("".join(map(SWEEP_LINE.format, conflict_rates.tolist(), max_tps.tolist())))
+
+    # Sensitivity to shard count and conflict rate together
+    shard_counts = np.arange(1, 257)
+    conflict_grid = np.linspace(0, 0.5, 51)
+    tps_grid = calculate_tps_grid(shard_counts, P, conflict_grid)
+
+    print()
+    print(f"Max TPS over N=1..256 x C_r=0..0.5 (P={P}), sampled:")
+    print("N \\ C_r " + " ".join(f"{C_r:>9.2f}" for C_r in conflict_grid[::10]))
+    for N_sample in (16, 64, 256):
+        row = tps_grid[N_sample - 1, ::10]
+        print(f"{N_sample:>7} " + " ".join(f"{tps:>9,.0f}" for tps in row))
@@ -1,4 +1,10 @@
+class PrepareError(Exception):
+    """Raised by a participant that cannot prepare; treated as a refusal."""
+
 class Participant:
+    # Slots drop the per-instance __dict__; the flags stay plain attributes
+    __slots__ = ('name', 'prepared', 'committed', 'aborted')
+
     def __init__(self, name):
         self.name = name
         self.prepared = False
@@ -25,25 +31,31 @@ class Coordinator:
         self.participants = participants
 
     def execute_transaction(self):
-        # Phase 1: Prepare
-        prepared_participants = []
-        try:
-            for p in self.participants:
-                if not p.prepare():
-                    raise Exception("Participant failed to prepare")
-                prepared_participants.append(p)
-        except Exception:
-            self.abort_transaction(self.participants)
-            return "Abort"
+        """
+        Run both phases over all participants.
 
-        # Phase 2: Commit
-        if len(prepared_participants) == len(self.participants):
-            self.commit_transaction(prepared_participants)
-            return "Commit"
-        else:
-            self.abort_transaction(prepared_participants)
-            return "Abort"
+        Returns "Commit", or "Abort" if a participant's prepare returns a
+        falsy value or raises PrepareError. Any other exception from prepare
+        is a bug rather than a refusal: every participant is aborted and the
+        exception propagates to the caller.
+        """
+        # Phase 1: Prepare; any refusal aborts everyone
+        for p in self.participants:
+            try:
+                prepared = p.prepare()
+            except PrepareError:
+                prepared = False
+            except BaseException:
+                # Unexpected failure: release everyone already prepared
+                self.abort_transaction(self.participants)
+                raise
+            if not prepared:
+                self.abort_transaction(self.participants)
+                return "Abort"
 
+        # Phase 2: Commit
+        self.commit_transaction(self.participants)
+        return "Commit"
 
     def commit_transaction(self, participants):
         for p in participants:
@@ -6,6 +6,7 @@ Working SeirChain Implementation Demo
 import time
 import hashlib
 import random
+from concurrent.futures import ProcessPoolExecutor
 from seirchain.pof.core import ProofOfFractal, create_pof_puzzle, solve_pof_puzzle, verify_pof_solution
 from seirchain.pof.difficulty import DynamicDifficultyAdjuster
 
@@ -55,6 +56,12 @@ def test_pof_self_similar():
     return True
 
 
+def _solve_one(task):
+    """Solve one (difficulty, puzzle) pair; module level so workers can unpickle it."""
+    difficulty, puzzle = task
+    return difficulty, solve_pof_puzzle(puzzle, max_iterations=10000)
+
+
 def test_complete_system():
     """Test complete system integration"""
     print("\n=== Testing Complete System ===")
@@ -62,12 +69,13 @@ def test_complete_system():
     # Create PoF instance
     pof = ProofOfFractal()
     
-    # Test with different difficulties
-    for difficulty in [4, 6, 8]:
+    # Test with different difficulties, solving the puzzles concurrently
+    tasks = [(d, create_pof_puzzle(f"test_data_{d}".encode(), d)) for d in (4, 6, 8)]
+    with ProcessPoolExecutor(max_workers=len(tasks)) as executor:
+        results = list(executor.map(_solve_one, tasks))
+    
+    for difficulty, solution in results:
         print(f"\nTesting difficulty {difficulty}:")
-        puzzle = create_pof_puzzle(f"test_data_{difficulty}".encode(), difficulty)
-        solution = solve_pof_puzzle(puzzle, max_iterations=10000)
-        
         if solution:
             print(f"  ✓ Solved with nonce {solution.nonce}")
             print(f"  ✓ Hash: {solution.hash_result[:16]}...")
@@ -83,7 +91,7 @@ def main():
     print("SEIRCHAIN IMPLEMENTATION TEST")
     print("="*60)
     
-    start = time.time()
+    start_ns = time.perf_counter_ns()
     
     tests = [
         ("PoF Core", test_pof),
@@ -94,8 +102,10 @@ def main():
     
     passed = 0
     total = len(tests)
+    test_times_ns = {}
     
     for name, test_func in tests:
+        test_start_ns = time.perf_counter_ns()
         try:
             if test_func():
                 passed += 1
@@ -104,12 +114,15 @@ def main():
                 print(f"✗ {name}: FAILED")
         except Exception as e:
             print(f"✗ {name}: ERROR - {e}")
+        test_times_ns[name] = time.perf_counter_ns() - test_start_ns
     
-    end = time.time()
+    elapsed_ns = time.perf_counter_ns() - start_ns
     
     print("\n" + "="*60)
     print(f"FINAL RESULTS: {passed}/{total} tests passed")
-    print(f"Total execution time: {end-start:.2f}s")
+    print(f"Total execution time: {elapsed_ns/1e9:.2f}s")
+    for name, test_ns in test_times_ns.items():
+        print(f"  {name}: {test_ns/1e9:.3f}s")
     print("="*60)
     
     if passed == total:
@@ -8,14 +8,24 @@ import pytest
 import time
 import json
 import os
+from py_ecc.bls import G2ProofOfPossession as bls_pop
+from py_ecc.bls.g2_primitives import G1_to_pubkey, G2_to_signature, pubkey_to_G1
+from py_ecc.optimized_bls12_381 import Z2, curve_order, neg
+from seir_chain.crypto import bls_production
 from seir_chain.crypto.bls_production import ProductionBLS, BLSKeyPair, BLSSignature
 
+@pytest.fixture(scope="session")
+def bls():
+    """One ProductionBLS instance shared by the whole session."""
+    return ProductionBLS()
+
 class TestProductionBLS:
     """Test suite for production BLS implementation."""
     
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.bls = ProductionBLS()
+    @pytest.fixture(autouse=True)
+    def _bind_bls(self, bls):
+        """Expose the shared instance as self.bls."""
+        self.bls = bls
     
     def test_key_generation(self):
         """Test key pair generation."""
@@ -25,6 +35,14 @@ class TestProductionBLS:
         assert len(key_pair.public_key) == 48
         assert key_pair.key_id == "test_key"
     
+    def test_fixed_base_public_key_derivation(self):
+        """The fixed-base table gives the same keys as py_ecc's SkToPk."""
+        secret_keys = [1, 2, 15, 16, 17, 2**64 + 5, curve_order // 2, curve_order - 1]
+        secret_keys += [int.from_bytes(os.urandom(32), 'big') % (curve_order - 1) + 1
+                        for _ in range(4)]
+        for secret_key in secret_keys:
+            assert bls_production._sk_to_pk(secret_key) == bls_pop.SkToPk(secret_key)
+    
     def test_sign_and_verify(self):
         """Test basic signing and verification."""
         message = b"test_message"
@@ -147,6 +165,39 @@ class TestProductionBLS:
         assert results["invalid_signatures"] == 1
         assert len(results["invalid_indices"]) == 1
     
+    def _signed_batch(self, count, invalid_indices):
+        """count signatures by distinct keys, with the given ones tampered."""
+        key_pairs = self.bls.generate_key_pairs(count)
+        signatures = []
+        for i, key_pair in enumerate(key_pairs):
+            signature = self.bls.sign_message(f"batch_message_{i}".encode(), key_pair.secret_key)
+            if i in invalid_indices:
+                signature = BLSSignature(signature.signature, signature.public_key, b"tampered")
+            signatures.append(signature)
+        return signatures
+    
+    def test_batch_verification_bisects_large_halves(self):
+        """A bad signature is found through combined checks on large halves."""
+        # 24 -> 12 -> 6 -> 3: two levels of halves above SMALL_BATCH_LIMIT
+        assert 24 // 4 > bls_production.SMALL_BATCH_LIMIT
+        signatures = self._signed_batch(24, {17})
+        results = self.bls.batch_verify(signatures)
+        assert results["valid_signatures"] == 23
+        assert results["invalid_indices"] == [17]
+    
+    def test_batch_verification_parallel(self):
+        """Slices verified in worker processes report batch-wide indices."""
+        signatures = self._signed_batch(12, {1, 7})
+        try:
+            results = self.bls.batch_verify(signatures, workers=2)
+            assert bls_production._verify_pool_workers == 2
+        finally:
+            bls_production._shutdown_verify_pool()
+        assert bls_production._verify_pool is None
+        assert results["total_signatures"] == 12
+        assert results["valid_signatures"] == 10
+        assert sorted(results["invalid_indices"]) == [1, 7]
+    
     def test_serialization(self):
         """Test signature serialization and deserialization."""
         key_pair = self.bls.generate_key_pair()
@@ -155,7 +206,7 @@ class TestProductionBLS:
         
         # Serialize
         serialized = self.bls.serialize_signature(signature)
-        assert isinstance(serialized, str)
+        assert isinstance(serialized, bytes)
         
         # Deserialize
         deserialized = self.bls.deserialize_signature(serialized)
@@ -163,6 +214,16 @@ class TestProductionBLS:
         assert deserialized.signature == signature.signature
         assert deserialized.public_key == signature.public_key
         assert deserialized.message == signature.message
+        assert deserialized.timestamp == signature.timestamp
+        
+        # Text form round-trips too
+        text = self.bls.serialize_signature_str(signature)
+        assert self.bls.deserialize_signature_str(text) == signature
+        
+        # Truncated input is rejected, including inside the header
+        for truncated in (b"", serialized[:10], serialized[:-1]):
+            with pytest.raises(ValueError):
+                self.bls.deserialize_signature(truncated)
     
     def test_error_handling(self):
         """Test error handling for edge cases."""
@@ -198,7 +259,7 @@ class TestProductionBLS:
     
     def test_key_pair_generation_uniqueness(self):
         """Test that generated key pairs are unique."""
-        key_pairs = [self.bls.generate_key_pair() for _ in range(100)]
+        key_pairs = self.bls.generate_key_pairs(100)
         secret_keys = [kp.secret_key for kp in key_pairs]
         public_keys = [kp.public_key for kp in key_pairs]
         
@@ -231,10 +292,47 @@ class TestProductionBLS:
             message
         ) is True
     
+    def test_proof_of_possession(self):
+        """Test possession proofs and fast aggregate verification."""
+        message = b"pop_test_message"
+        key_pairs = self.bls.generate_key_pairs(3)
+        
+        proofs = [self.bls.pop_prove(kp.secret_key) for kp in key_pairs]
+        for key_pair, proof in zip(key_pairs, proofs):
+            assert self.bls.pop_verify(key_pair.public_key, proof) is True
+        # A proof does not transfer to another key
+        assert self.bls.pop_verify(key_pairs[0].public_key, proofs[1]) is False
+        
+        signatures = [self.bls.sign_message(message, kp.secret_key).signature for kp in key_pairs]
+        aggregated_sig = self.bls.aggregate_signatures(signatures)
+        public_keys = [kp.public_key for kp in key_pairs]
+        assert self.bls.fast_aggregate_verify(public_keys, message, aggregated_sig) is True
+        assert self.bls.fast_aggregate_verify(public_keys[:2], message, aggregated_sig) is False
+        assert self.bls.fast_aggregate_verify([], message, aggregated_sig) is False
+        
+        # Keys that cancel out aggregate to infinity and are rejected
+        public_key = key_pairs[0].public_key
+        negated_key = G1_to_pubkey(neg(pubkey_to_G1(public_key)))
+        infinity_sig = G2_to_signature(Z2)
+        assert self.bls.fast_aggregate_verify([public_key, negated_key], b"any", infinity_sig) is False
+    
+    def test_aggregate_public_keys_by_exclusion(self):
+        """Test committee aggregate minus absent members matches direct aggregation."""
+        public_keys = [self.bls.generate_key_pair().public_key for _ in range(5)]
+        self.bls.set_committee(public_keys)
+        
+        signers = [public_keys[0], public_keys[2], public_keys[4]]
+        absent = [public_keys[1], public_keys[3]]
+        assert self.bls.aggregate_public_keys_by_exclusion(absent) == \
+            self.bls.aggregate_public_keys(signers)
+        
+        with pytest.raises(ValueError, match="not a committee member"):
+            self.bls.aggregate_public_keys_by_exclusion([self.bls.generate_key_pair().public_key])
+    
     def test_stress_test(self):
-        """Stress test with large number of signatures."""
+        """Stress test with large number of signatures from one signer."""
         num_signatures = 1000
-        signatures = self.bls.generate_test_data(num_signatures)
+        signatures = self.bls.generate_test_data(num_signatures, key_count=1)
         
         results = self.bls.batch_verify(signatures)
         assert results["total_signatures"] == num_signatures
@@ -0,0 +1,164 @@
+import importlib.util
+import os
+import threading
+import unittest
+from unittest import mock
+
+import numpy as np
+
+# Loaded by path: the seirchain.svm package __init__ imports an
+# execution.parallel module that is not in the tree
+_spec = importlib.util.spec_from_file_location(
+    "cross_shard",
+    os.path.join(os.path.dirname(__file__), "..", "src", "seirchain", "svm",
+                 "sharding", "cross_shard.py"))
+cross_shard = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(cross_shard)
+ShardedDict = cross_shard.ShardedDict
+TwoPhaseCommit = cross_shard.TwoPhaseCommit
+TransactionStatus = cross_shard.TransactionStatus
+
+class FixedDraws:
+    """Stands in for np.random.Generator, returning preset prepare samples."""
+
+    def __init__(self, samples=None):
+        self.samples = samples
+
+    def random(self, size):
+        if self.samples is None:
+            return np.ones(size)
+        return np.array(self.samples[:size])
+
+class TestPrepareDraws(unittest.TestCase):
+
+    def test_seeded_generator_is_reproducible_on_both_paths(self):
+        for size in (3, cross_shard._BATCH_DRAW_MIN_PARTICIPANTS + 8):
+            triad_ids = list(range(size))
+            expected = (np.random.default_rng(7).random(size) > 0.1).tolist()
+            for _ in range(2):
+                tpc = TwoPhaseCommit(rng=np.random.default_rng(7))
+                tx_id = tpc.begin_cross_shard_transaction(triad_ids, {})
+                self.assertEqual(tpc.prepare_phase(tx_id), dict(zip(triad_ids, expected)))
+
+class TestCleanup(unittest.TestCase):
+
+    def test_cleanup_evicts_only_expired_terminal_transactions(self):
+        tpc = TwoPhaseCommit(rng=FixedDraws())
+        with mock.patch.object(cross_shard.time, 'time', return_value=1000.0):
+            aborted = tpc.begin_cross_shard_transaction([1, 2], {})
+            committed = tpc.begin_cross_shard_transaction([1, 2], {})
+            in_flight = tpc.begin_cross_shard_transaction([1, 2], {})
+            tpc.abort_transaction(aborted)
+            # A repeated abort is not queued twice
+            tpc.abort_transaction(aborted)
+        with mock.patch.object(cross_shard.time, 'time', return_value=2000.0):
+            tpc.prepare_phase(committed)
+            with mock.patch('builtins.print'):
+                self.assertTrue(tpc.commit_phase(committed))
+        self.assertEqual(len(tpc._terminal), 2)
+
+        with mock.patch.object(cross_shard.time, 'time', return_value=2500.0):
+            tpc.cleanup_old_transactions(max_age=1000.0)
+        self.assertIsNone(tpc.get_transaction_status(aborted))
+        self.assertEqual(tpc.get_transaction_status(committed), TransactionStatus.COMMITTED)
+        self.assertEqual(tpc.get_transaction_status(in_flight), TransactionStatus.INITIATED)
+
+        with mock.patch.object(cross_shard.time, 'time', return_value=10000.0):
+            tpc.cleanup_old_transactions(max_age=1000.0)
+        self.assertIsNone(tpc.get_transaction_status(committed))
+        self.assertEqual(tpc.get_transaction_status(in_flight), TransactionStatus.INITIATED)
+        self.assertEqual(len(tpc._terminal), 0)
+
+class TestTransactionInfo(unittest.TestCase):
+
+    def test_participant_flags_map_to_triad_ids(self):
+        tpc = TwoPhaseCommit(rng=FixedDraws([0.5, 0.05, 0.9]))
+        tx_id = tpc.begin_cross_shard_transaction([5, 9, 2], {5: 'a', 9: 'b', 2: 'c'})
+        info = tpc.get_transaction_info(tx_id)
+        self.assertEqual(info['participants'], {5: False, 9: False, 2: False})
+        self.assertEqual(info['coordinator_triad'], 5)
+
+        self.assertEqual(tpc.prepare_phase(tx_id), {5: True, 9: False, 2: True})
+        info = tpc.get_transaction_info(tx_id)
+        self.assertEqual(info['participants'], {5: True, 9: False, 2: True})
+        self.assertEqual(info['status'], 'aborting')
+        self.assertIsNone(tpc.get_transaction_info("missing"))
+
+class TestShardedDict(unittest.TestCase):
+
+    def test_rejects_non_power_of_two(self):
+        for num_shards in (0, 3, 12):
+            with self.assertRaises(ValueError):
+                ShardedDict(num_shards)
+
+    def test_mapping_operations(self):
+        sharded = ShardedDict(4)
+        for i in range(50):
+            sharded[f"k{i}"] = i
+        self.assertEqual(len(sharded), 50)
+        self.assertEqual(sharded["k7"], 7)
+        self.assertEqual(sharded.get("missing", -1), -1)
+        self.assertIn("k3", sharded)
+        del sharded["k3"]
+        self.assertNotIn("k3", sharded)
+        self.assertEqual(sharded.pop("k4"), 4)
+        self.assertIsNone(sharded.pop("k4", None))
+        with self.assertRaises(KeyError):
+            sharded["k4"]
+        expected = {f"k{i}": i for i in range(50) if i not in (3, 4)}
+        self.assertEqual(dict(sharded.items()), expected)
+        self.assertEqual(sorted(sharded), sorted(expected))
+        self.assertIs(sharded.lock_for("k7"), sharded.lock_for("k7"))
+
+    def test_concurrent_read_modify_write(self):
+        sharded = ShardedDict(4)
+        keys = [f"k{i}" for i in range(8)]
+
+        def worker():
+            for _ in range(500):
+                for key in keys:
+                    with sharded.lock_for(key):
+                        sharded[key] = sharded.get(key, 0) + 1
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(dict(sharded.items()), {key: 2000 for key in keys})
+
+class TestTwoPhaseCommitFlow(unittest.TestCase):
+
+    def test_begin_prepare_commit(self):
+        tpc = TwoPhaseCommit(rng=FixedDraws())
+        tx_id = tpc.begin_cross_shard_transaction([1, 2, 3], {1: 'debit', 3: 'credit'})
+        self.assertEqual(tpc.get_transaction_status(tx_id), TransactionStatus.INITIATED)
+        # Commit before prepare is refused
+        self.assertFalse(tpc.commit_phase(tx_id))
+
+        self.assertEqual(tpc.prepare_phase(tx_id), {1: True, 2: True, 3: True})
+        self.assertEqual(tpc.get_transaction_status(tx_id), TransactionStatus.PREPARED)
+        with mock.patch('builtins.print') as printed:
+            self.assertTrue(tpc.commit_phase(tx_id))
+        self.assertEqual(printed.call_count, 2)
+        self.assertEqual(tpc.get_transaction_status(tx_id), TransactionStatus.COMMITTED)
+        self.assertFalse(tpc.commit_phase(tx_id))
+
+    def test_refused_prepare_aborts(self):
+        tpc = TwoPhaseCommit(rng=FixedDraws([0.5, 0.0]))
+        tx_id = tpc.begin_cross_shard_transaction([1, 2], {})
+        self.assertEqual(tpc.prepare_phase(tx_id), {1: True, 2: False})
+        self.assertEqual(tpc.get_transaction_status(tx_id), TransactionStatus.ABORTING)
+        self.assertFalse(tpc.commit_phase(tx_id))
+        self.assertTrue(tpc.abort_transaction(tx_id))
+        self.assertEqual(tpc.get_transaction_status(tx_id), TransactionStatus.ABORTED)
+
+    def test_unknown_transaction(self):
+        tpc = TwoPhaseCommit()
+        self.assertEqual(tpc.prepare_phase("missing"), {})
+        self.assertFalse(tpc.commit_phase("missing"))
+        self.assertFalse(tpc.abort_transaction("missing"))
+        self.assertIsNone(tpc.get_transaction_status("missing"))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,5 @@
 import unittest
-from gas import calculate_gas
+from gas import calculate_gas, calculate_gas_bytes, OPCODE_BYTES
 
 class TestGas(unittest.TestCase):
 
@@ -16,5 +16,13 @@ class TestGas(unittest.TestCase):
         opcodes4 = []
         self.assertEqual(calculate_gas(opcodes4), 0)
 
+    def test_calculate_gas_bytes(self):
+        opcodes = ["PUSH", "PUSH", "ADD", "STORE", "LOAD", "MUL", "STOP"]
+        code = bytes(OPCODE_BYTES[opcode] for opcode in opcodes)
+        self.assertEqual(calculate_gas_bytes(code), calculate_gas(opcodes))
+
+        self.assertEqual(calculate_gas_bytes(b"\xfe\x01"), 4)
+        self.assertEqual(calculate_gas_bytes(b""), 0)
+
 if __name__ == '__main__':
     unittest.main()
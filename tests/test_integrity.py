@@ -6,6 +6,7 @@ Tests all cryptographic components, Triad structure, and Fractal Merkle Anchor
 import hashlib
 import json
 import time
+import pytest
 from seirchain.crypto.transaction import Transaction
 from seirchain.crypto.wallet import Wallet
 from seirchain.crypto.dilithium import DilithiumWallet, DilithiumSigner
@@ -14,47 +15,22 @@ from seirchain.structures.merkle import MerkleTree, compute_merkle_root
 from seirchain.integrity.fma import FractalMerkleAnchor
 
 
-class TestRunner:
-    """Test runner for all integrity features"""
-    
-    def __init__(self):
-        self.test_results = []
-        self.passed = 0
-        self.failed = 0
-    
-    def run_test(self, test_name: str, test_func):
-        """Run a single test and record results"""
-        try:
-            result = test_func()
-            if result:
-                self.passed += 1
-                self.test_results.append(f"✅ {test_name}")
-            else:
-                self.failed += 1
-                self.test_results.append(f"❌ {test_name}")
-        except Exception as e:
-            self.failed += 1
-            self.test_results.append(f"❌ {test_name} (Error: {str(e)})")
-    
-    def print_results(self):
-        """Print test results"""
-        print("\n" + "="*60)
-        print("SEIRCHAIN INTEGRITY TEST RESULTS")
-        print("="*60)
-        for result in self.test_results:
-            print(result)
-        print(f"\nPassed: {self.passed}, Failed: {self.failed}")
-        print("="*60)
+@pytest.fixture(scope="module")
+def wallet1():
+    """Sender wallet shared by every test in the module (key generation is slow)"""
+    return Wallet()
 
 
-def test_transaction_signing():
+@pytest.fixture(scope="module")
+def wallet2():
+    """Recipient wallet shared by every test in the module"""
+    return Wallet()
+
+
+def test_transaction_signing(wallet1, wallet2):
     """Test transaction signing and verification"""
     print("\n🔐 Testing Transaction Signing...")
     
-    # Create wallets
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     # Create transaction
     tx = Transaction(wallet1.get_address(), wallet2.get_address(), 10.5)
     
@@ -68,7 +44,7 @@ def test_transaction_signing():
     print(f"   Transaction: {tx}")
     print(f"   Signature valid: {is_valid}")
     
-    return is_valid
+    assert is_valid
 
 
 def test_dilithium_signatures():
@@ -95,17 +71,13 @@ def test_dilithium_signatures():
     print(f"   Dilithium signature: {signature[:16]}...")
     print(f"   Signature valid: {is_valid}")
     
-    return is_valid
+    assert is_valid
 
 
-def test_merkle_tree():
+def test_merkle_tree(wallet1, wallet2):
     """Test Merkle tree construction and proofs"""
     print("\n🌳 Testing Merkle Tree...")
     
-    # Create transactions
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     transactions = [
         Transaction(wallet1.get_address(), wallet2.get_address(), 10.0),
         Transaction(wallet2.get_address(), wallet1.get_address(), 5.0),
@@ -127,17 +99,13 @@ def test_merkle_tree():
     print(f"   Proof valid: {is_valid}")
     print(f"   Tree size: {len(tree)} transactions")
     
-    return is_valid and merkle_root is not None
+    assert is_valid and merkle_root is not None
 
 
-def test_triad_structure():
+def test_triad_structure(wallet1, wallet2):
     """Test Triad structure and integrity"""
     print("\n🔺 Testing Triad Structure...")
     
-    # Create wallets and transactions
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     transactions = [
         Transaction(wallet1.get_address(), wallet2.get_address(), 10.0),
         Transaction(wallet2.get_address(), wallet1.get_address(), 5.0)
@@ -161,17 +129,13 @@ def test_triad_structure():
     print(f"   Merkle root valid: {is_merkle_valid}")
     print(f"   Coordinates: {triad.coordinates.to_ternary_string()}")
     
-    return is_integrity_valid and is_merkle_valid
+    assert is_integrity_valid and is_merkle_valid
 
 
-def test_triad_chain():
+def test_triad_chain(wallet1, wallet2):
     """Test Triad chain with parent linking"""
     print("\n⛓️ Testing Triad Chain...")
     
-    # Create wallets
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     # Create chain
     chain = TriadChain()
     
@@ -204,17 +168,13 @@ def test_triad_chain():
     print(f"   Chain integrity: {chain_integrity}")
     print(f"   Chain length: {chain.get_chain_length()}")
     
-    return genesis_added and child_added and chain_integrity
+    assert genesis_added and child_added and chain_integrity
 
 
-def test_fma_verification():
+def test_fma_verification(wallet1, wallet2):
     """Test Fractal Merkle Anchor verification"""
     print("\n⚓ Testing Fractal Merkle Anchor...")
     
-    # Create test triad
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     transactions = [
         Transaction(wallet1.get_address(), wallet2.get_address(), 10.0),
         Transaction(wallet2.get_address(), wallet1.get_address(), 5.0)
@@ -241,17 +201,13 @@ def test_fma_verification():
     print(f"   Triad valid: {is_valid}")
     print(f"   Tamper detection: {demo['detection_success']}")
     
-    return is_valid and demo['detection_success']
+    assert is_valid and demo['detection_success']
 
 
-def test_tamper_detection():
+def test_tamper_detection(wallet1, wallet2):
     """Test comprehensive tamper detection"""
     print("\n🚨 Testing Tamper Detection...")
     
-    # Create original triad
-    wallet1 = Wallet()
-    wallet2 = Wallet()
-    
     original_transactions = [
         Transaction(wallet1.get_address(), wallet2.get_address(), 10.0),
         Transaction(wallet2.get_address(), wallet1.get_address(), 5.0)
@@ -283,7 +239,7 @@ def test_tamper_detection():
     print(f"   Tampered valid: {tampered_valid}")
     print(f"   Merkle roots different: {original_merkle != tampered_merkle}")
     
-    return original_valid and not tampered_valid and (original_merkle != tampered_merkle)
+    assert original_valid and not tampered_valid and (original_merkle != tampered_merkle)
 
 
 def test_ternary_coordinates():
@@ -311,7 +267,7 @@ def test_ternary_coordinates():
     print(f"   Address: {address}")
     print(f"   Round-trip valid: {is_valid}")
     
-    return is_valid and len(address) == 32
+    assert is_valid and len(address) == 32
 
 
 def test_merkle_proofs():
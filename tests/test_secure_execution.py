@@ -0,0 +1,145 @@
+import ast
+import importlib.util
+import os
+import sys
+import unittest
+
+# Loaded by path: the seirchain.svm package __init__ imports an
+# execution.parallel module that is not in the tree
+_spec = importlib.util.spec_from_file_location(
+    "secure_execution",
+    os.path.join(os.path.dirname(__file__), "..", "src", "seirchain", "svm",
+                 "security", "secure_execution.py"))
+secure_execution = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(secure_execution)
+DeterministicExecution = secure_execution.DeterministicExecution
+SecureExecutionEnvironment = secure_execution.SecureExecutionEnvironment
+
+class TestMakeDeterministic(unittest.TestCase):
+
+    def assertDeterministic(self, code, expected):
+        result = DeterministicExecution.make_deterministic(code)
+        compile(result, '<test>', 'exec')
+        self.assertTrue(DeterministicExecution.validate_deterministic(result))
+        self.assertEqual(ast.dump(ast.parse(result)), ast.dump(ast.parse(expected)))
+
+    def test_removes_imports_and_uses(self):
+        self.assertDeterministic(
+            "import random, math\nx = random.random()\ny = math.sqrt(4)",
+            "import math\ny = math.sqrt(4)")
+
+    def test_pads_emptied_body(self):
+        self.assertDeterministic(
+            "def f():\n    return time.time()",
+            "def f():\n    pass")
+
+    def test_pads_emptied_finalbody(self):
+        self.assertDeterministic(
+            "try:\n    x = 1\nfinally:\n    y = random.random()",
+            "try:\n    x = 1\nfinally:\n    pass")
+
+    def test_pads_emptied_handler(self):
+        self.assertDeterministic(
+            "try:\n    x = 1\nexcept ValueError:\n    x = random.random()\nelse:\n    y = time.time()",
+            "try:\n    x = 1\nexcept ValueError:\n    pass")
+
+    def test_match_cases(self):
+        self.assertDeterministic(
+            "match x:\n"
+            "    case 1:\n        y = random.random()\n"
+            "    case 2 if time.time() > 0:\n        y = 2\n"
+            "    case _:\n        y = 3",
+            "match x:\n"
+            "    case 1:\n        pass\n"
+            "    case _:\n        y = 3")
+
+    def test_drops_match_without_cases(self):
+        self.assertDeterministic(
+            "def f(x):\n    match x:\n        case time.X:\n            return 1",
+            "def f(x):\n    pass")
+
+    def test_unparsable_code_unchanged(self):
+        self.assertEqual(DeterministicExecution.make_deterministic("def ("), "def (")
+
+def _vm_size_mb():
+    with open('/proc/self/status') as status:
+        for line in status:
+            if line.startswith('VmSize:'):
+                return int(line.split()[1]) // 1024
+    raise RuntimeError('VmSize not reported')
+
+@unittest.skipUnless(sys.platform.startswith('linux'), "needs fork and /proc")
+class TestIsolatedExecution(unittest.TestCase):
+
+    def setUp(self):
+        self.env = SecureExecutionEnvironment()
+
+    def test_result_round_trip(self):
+        result = self.env.execute_contract_isolated(
+            "total = base * 2\nlabel = str(total)\nf = lambda: total",
+            {'base': 21}, cpu_seconds=5)
+        self.assertTrue(result['success'])
+        # The lambda cannot be pickled and is dropped
+        self.assertEqual(result['result'], {'total': 42, 'label': '42'})
+        self.assertNotIn('globals', result)
+
+    def test_rejects_unsafe_code(self):
+        result = self.env.execute_contract_isolated("import os\nos.getpid()")
+        self.assertEqual(result, {'error': 'Invalid or unsafe code', 'success': False})
+
+    def test_wall_clock_timeout(self):
+        result = self.env.execute_contract_isolated(
+            "while True:\n    pass", cpu_seconds=10, timeout=0.5)
+        self.assertFalse(result['success'])
+        self.assertEqual(result['type'], 'TimeoutError')
+
+    def test_memory_limit(self):
+        # The limit covers the forked interpreter's existing address space
+        result = self.env.execute_contract_isolated(
+            "data = 'x' * (1024 * 1024 * 1024)",
+            cpu_seconds=10, memory_mb=_vm_size_mb() + 256)
+        self.assertFalse(result['success'])
+        self.assertEqual(result['type'], 'MemoryError')
+
+class TestRegisteredContracts(unittest.TestCase):
+
+    def setUp(self):
+        self.env = SecureExecutionEnvironment()
+
+    def test_namespace_persists_between_calls(self):
+        code = (
+            "state = {'count': 0}\n"
+            "def increment(step=1):\n"
+            "    state['count'] += step\n"
+            "    return state['count']\n"
+            "def double(x):\n"
+            "    return increment(x) * 2\n")
+        self.assertEqual(self.env.register_contract("c1", code),
+                         {'success': True, 'functions': ['double', 'increment']})
+        self.assertEqual(self.env.call_function("c1", "increment")['result'], 1)
+        self.assertEqual(self.env.call_function("c1", "increment", kwargs={'step': 2})['result'], 3)
+        # Functions see each other and module-level names through one namespace
+        self.assertEqual(self.env.call_function("c1", "double", [1])['result'], 8)
+
+    def test_reregistration_replaces_functions(self):
+        self.env.register_contract("c1", "def old():\n    return 1\ndef kept():\n    return 1")
+        self.env.register_contract("c2", "def old():\n    return 2")
+        self.env.register_contract("c1", "def kept():\n    return 3")
+        self.assertFalse(self.env.call_function("c1", "old")['success'])
+        self.assertEqual(self.env.call_function("c1", "kept")['result'], 3)
+        # Other contracts are untouched
+        self.assertEqual(self.env.call_function("c2", "old")['result'], 2)
+
+    def test_unknown_function(self):
+        self.env.register_contract("c1", "def f():\n    return 1")
+        self.assertEqual(self.env.call_function("c1", "g"),
+                         {'error': 'Function g not found', 'success': False})
+        self.assertFalse(self.env.call_function("missing", "f")['success'])
+
+    def test_rejects_unsafe_code(self):
+        result = self.env.register_contract("c1", "import os\ndef f():\n    return os.getpid()")
+        self.assertFalse(result['success'])
+        self.assertFalse(self.env.call_function("c1", "f")['success'])
+
+if __name__ == '__main__':
+    unittest.main()
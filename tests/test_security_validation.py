@@ -6,68 +6,62 @@ Tests all security modules and attack prevention mechanisms.
 
 import pytest
 import time
-import hashlib
-from typing import List, Dict, Any
+from hashlib import sha256 as _sha256
+import numpy as np
+from functools import lru_cache
+from typing import List
+from py_ecc.bls.g2_primitives import G1_to_pubkey, pubkey_to_G1
+from py_ecc.optimized_bls12_381 import Z1, add, neg
 from seir_chain.crypto.bls_production import ProductionBLS
 
-class MockValidator:
-    """Mock validator for testing security mechanisms."""
-    
-    def __init__(self, validator_id: str, stake: int):
-        self.validator_id = validator_id
-        self.stake = stake
-        self.reputation = 100
-        self.slash_count = 0
+@lru_cache(maxsize=1024)
+def _checkpoint_digest(height: int) -> bytes:
+    """SHA-256 digest of a checkpoint, computed once per height per run."""
+    return _sha256(f"checkpoint_{height}".encode()).digest()
 
-class SecurityTestSuite:
+class TestSecuritySuite:
     """Comprehensive security testing framework."""
     
-    def __init__(self):
+    NUM_VALIDATORS = 10
+    
+    def setup_method(self, method):
+        """Set up a fresh BLS instance and mock validator set for each test."""
+        num_validators = self.NUM_VALIDATORS
         self.bls = ProductionBLS()
-        self.validators = {}
-        
-    def setup_test_environment(self, num_validators: int = 10):
-        """Set up test environment with mock validators."""
-        for i in range(num_validators):
-            validator_id = f"validator_{i}"
-            stake = 1000 + i * 100
-            self.validators[validator_id] = MockValidator(validator_id, stake)
+        # Mock validator set, one array per field indexed by _id_to_idx
+        self._ids = [f"validator_{i}" for i in range(num_validators)]
+        self._id_to_idx = {validator_id: i for i, validator_id in enumerate(self._ids)}
+        self._stake = 1000 + 100 * np.arange(num_validators, dtype=np.int64)
+        self._reputation = np.full(num_validators, 100, dtype=np.int32)
+        self._slash_count = np.zeros(num_validators, dtype=np.int32)
+    
+    def _slash(self, validator_ids: List[str]):
+        """Apply the 10% slashing penalty to the given validators in one pass."""
+        indices = [self._id_to_idx[validator_id] for validator_id in validator_ids]
+        self._slash_count[indices] += 1
+        self._stake[indices] -= self._stake[indices] // 10
     
     def test_validator_slashing(self):
         """Test validator slashing mechanisms."""
         print("Testing validator slashing...")
         
         # Test double signing detection
-        validator = self.validators["validator_0"]
-        original_stake = validator.stake
+        i = self._id_to_idx["validator_0"]
+        original_stake = int(self._stake[i])
         
         # Simulate double signing
-        validator.slash_count += 1
-        penalty = validator.stake * 0.1  # 10% penalty
-        validator.stake -= int(penalty)
+        self._slash(["validator_0"])
         
-        assert validator.stake == original_stake - int(original_stake * 0.1)
-        assert validator.slash_count == 1
+        assert self._stake[i] == original_stake - int(original_stake * 0.1)
+        assert self._slash_count[i] == 1
         print("✓ Validator slashing test passed")
     
     def test_long_range_attack_defense(self):
         """Test long-range attack prevention mechanisms."""
         print("Testing long-range attack defense...")
         
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_allowed  # Should prevent deep reorgs
+        # Test checkpoint creation and deep reorganization prevention
+        self._assert_checkpoint_and_reorg(1000)
         
         print("✓ Long-range attack defense test passed")
     
@@ -76,15 +70,14 @@ class SecurityTestSuite:
         print("Testing nothing-at-stake prevention...")
         
         # Test slashing for voting on multiple chains
-        validator = self.validators["validator_1"]
+        i = self._id_to_idx["validator_1"]
+        original_stake = int(self._stake[i])
         
         # Simulate voting on two conflicting blocks
-        validator.slash_count += 1
-        penalty = validator.stake * 0.1  # 10% penalty
-        validator.stake -= int(penalty)
+        self._slash(["validator_1"])
         
-        assert validator.stake == original_stake - int(original_stake * 0.1)
-        assert validator.slash_count == 1
+        assert self._stake[i] == original_stake - int(original_stake * 0.1)
+        assert self._slash_count[i] == 1
         print("✓ Nothing-at-stake prevention test passed")
     
     def test_dos_protection(self):
@@ -99,34 +92,21 @@ class SecurityTestSuite:
         is_throttled = test_requests > max_requests_per_second
         assert is_throttled
         
-        # Test transaction size limits
-        max_tx_size = 1024  # 1KB
-        test_tx_size = 2048
-        
         # Test time drift tolerance
         max_drift = 70  # seconds
         local_time = 1000
-        network_time = median_time
+        network_time = 1030
         
         time_diff = abs(local_time - network_time)
         assert time_diff <= max_drift
         
         print("✓ DOS protection test passed")
     
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
+    def _assert_checkpoint_and_reorg(self, checkpoint_height: int):
+        """Check the checkpoint hash and that deep reorganizations are refused."""
         # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
+        checkpoint_digest = _checkpoint_digest(checkpoint_height)
+        is_valid_checkpoint = len(checkpoint_digest) == 32
         assert is_valid_checkpoint
         
         # Test deep reorganization prevention
@@ -135,140 +115,9 @@ class SecurityTestSuite:
         
         reorg_allowed = proposed_reorg_depth <= max_reorg_depth
         assert not reorg_allowed  # Should prevent deep reorgs
-        
-        print("✓ Long-range attack defense test passed")
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_allowed  # Should prevent deep reorgs
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_allowed  # Should prevent deep reorgs
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_allowed  # Should prevent deep reorgs
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
     
-    def test_signature_aggregation_security(self):
+    @pytest.mark.parametrize("checkpoint_height", [1000])
+    def test_signature_aggregation_security(self, checkpoint_height: int):
         """Test security of BLS signature aggregation."""
         print("Testing signature aggregation security...")
         
@@ -276,153 +125,29 @@ class SecurityTestSuite:
         honest_validators = 5
         malicious_validators = 1
         
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
+        checkpoint_message = _checkpoint_digest(checkpoint_height)
+        honest = self.bls.generate_key_pairs(honest_validators)
+        for key_pair in honest:
+            assert self.bls.pop_verify(key_pair.public_key, self.bls.pop_prove(key_pair.secret_key))
+        
+        # A rogue key pk_a - sum(honest pks) would let the attacker alone forge
+        # the committee signature, but the attacker cannot prove possession of it
+        honest_sum = Z1
+        for key_pair in honest:
+            honest_sum = add(honest_sum, pubkey_to_G1(key_pair.public_key))
+        for attacker in self.bls.generate_key_pairs(malicious_validators):
+            rogue_key = G1_to_pubkey(add(pubkey_to_G1(attacker.public_key), neg(honest_sum)))
+            assert not self.bls.pop_verify(rogue_key, self.bls.pop_prove(attacker.secret_key))
+        
+        # Honest keys with valid proofs aggregate and verify with two pairings
+        signatures = [self.bls.sign_message(checkpoint_message, kp.secret_key).signature
+                      for kp in honest]
+        assert self.bls.fast_aggregate_verify(
+            [kp.public_key for kp in honest],
+            checkpoint_message,
+            self.bls.aggregate_signatures(signatures)
         )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
         
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
+        self._assert_checkpoint_and_reorg(checkpoint_height)
         
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation."""
-        print("Testing signature aggregation security...")
-        
-        # Test rogue public key attack prevention
-        honest_validators = 5
-        malicious_validators = 1
-        
-        # Test checkpoint creation
-        checkpoint_height = 1000
-        checkpoint_hash = hashlib.sha256(f"checkpoint_{checkpoint_height}".encode()).hexdigest()
-        
-        # Test checkpoint validation
-        is_valid_checkpoint = len(checkpoint_hash) == 64
-        assert is_valid_checkpoint
-        
-        # Test deep reorganization prevention
-        max_reorg_depth = 100
-        proposed_reorg_depth = 150
-        
-        reorg_allowed = proposed_reorg_depth <= max_reorg_depth
-        assert not reorg_depth <= max_reorg_depth
-        
-        print("✓ Long-range attack defense test passed"
-        )
-    
-    def test_signature_aggregation_security(self):
-        """Test security of BLS signature aggregation
+        print("✓ Signature aggregation security test passed")
@@ -1,5 +1,23 @@
+import importlib.util
+import os
 import unittest
-from sharding import get_triad_id
+
+import numpy as np
+
+from sharding import get_triad_id, get_triad_ids
+
+# Loaded by path: the seirchain.svm package __init__ imports an
+# execution.parallel module that is not in the tree
+_spec = importlib.util.spec_from_file_location(
+    "triad_sharding",
+    os.path.join(os.path.dirname(__file__), "..", "src", "seirchain", "svm",
+                 "sharding", "triad_sharding.py"))
+triad_sharding = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(triad_sharding)
+TriadSharding = triad_sharding.TriadSharding
+FractalSharding = triad_sharding.FractalSharding
+jump_back_hash = triad_sharding.jump_back_hash
+jump_back_hash_array = triad_sharding.jump_back_hash_array
 
 class TestSharding(unittest.TestCase):
 
@@ -19,7 +37,129 @@ class TestSharding(unittest.TestCase):
         self.assertLess(triad_id2, num_triads)
 
         # Test determinism
-        self.assertEqual(get_triad_id(address1, num_triads), get_triad_id(address1, num_triads))
+        self.assertEqual(get_triad_id(address1, num_triads), triad_id1)
+        self.assertEqual(get_triad_id(address1.encode(), num_triads), triad_id1)
+
+    def test_get_triad_ids(self):
+        addresses = [f"0x{i:040x}" for i in range(100)]
+        num_triads = 10
+
+        triad_ids = get_triad_ids(addresses, num_triads)
+
+        self.assertEqual(triad_ids, [get_triad_id(address, num_triads) for address in addresses])
+        self.assertEqual(get_triad_ids([address.encode() for address in addresses], num_triads), triad_ids)
+        self.assertEqual(get_triad_ids([], num_triads), [])
+
+class TestJumpBackHash(unittest.TestCase):
+
+    def setUp(self):
+        self.keys = np.random.default_rng(0).integers(0, 2**64 - 1, size=4000, dtype=np.uint64)
+
+    def test_array_matches_scalar(self):
+        for num_buckets in (1, 2, 3, 7, 64, 100, 1000, (1 << 20) + 3):
+            expected = [jump_back_hash(key, num_buckets) for key in self.keys.tolist()]
+            self.assertEqual(jump_back_hash_array(self.keys, num_buckets).tolist(), expected)
+        self.assertEqual(len(jump_back_hash_array(self.keys[:0], 10)), 0)
+
+    def test_ids_in_range(self):
+        for num_buckets in (1, 2, 5, 17, 256, 1000):
+            buckets = jump_back_hash_array(self.keys, num_buckets)
+            self.assertGreaterEqual(buckets.min(), 0)
+            self.assertLess(buckets.max(), num_buckets)
+        # Every bucket gets roughly its share
+        counts = np.bincount(jump_back_hash_array(self.keys, 10), minlength=10)
+        self.assertTrue(np.all(np.abs(counts - 400) < 100), counts)
+
+    def test_growth_moves_only_into_new_buckets(self):
+        for old, new in ((10, 11), (10, 20), (64, 100), (1, 3)):
+            before = jump_back_hash_array(self.keys, old)
+            after = jump_back_hash_array(self.keys, new)
+            moved = before != after
+            self.assertTrue(np.all(after[moved] >= old), (old, new))
+            # The expected share is (new - old) / new
+            share = (new - old) / new
+            self.assertAlmostEqual(moved.mean(), share, delta=0.05)
+
+class TestTriadSharding(unittest.TestCase):
+
+    def test_resize_rebuckets_cache(self):
+        sharding = TriadSharding(num_triads=10)
+        addresses = [f"0x{i:040x}" for i in range(300)]
+        before = [sharding.get_triad_id(address) for address in addresses]
+
+        moved = sharding.resize(17)
+
+        after = sharding.get_triad_ids(addresses).tolist()
+        self.assertEqual(sorted(moved),
+                         sorted(a for a, b, c in zip(addresses, before, after) if b != c))
+        self.assertTrue(moved)
+        self.assertEqual(sharding.shard_mapping, dict(zip(addresses, after)))
+        self.assertEqual([sharding.get_triad_id(address) for address in addresses], after)
+
+    def test_resize_rejects_zero(self):
+        with self.assertRaises(ValueError):
+            TriadSharding(num_triads=10).resize(0)
+
+    def test_cache_is_bounded(self):
+        cache_size = 2 * triad_sharding._CACHE_SHARDS
+        sharding = TriadSharding(num_triads=10, cache_size=cache_size)
+        addresses = [f"0x{i:040x}" for i in range(500)]
+        expected = sharding.get_triad_ids(addresses).tolist()
+        for address in addresses:
+            sharding.get_triad_id(address)
+            self.assertLessEqual(len(sharding.shard_mapping), cache_size)
+        # The most recent address is cached, evicted ones are recomputed
+        self.assertIn(addresses[-1], sharding.shard_mapping)
+        self.assertEqual([sharding.get_triad_id(address) for address in addresses], expected)
+
+    def test_cache_evicts_least_recently_used(self):
+        sharding = TriadSharding(num_triads=10, cache_size=2 * triad_sharding._CACHE_SHARDS)
+        index = lambda address: hash(address) & (triad_sharding._CACHE_SHARDS - 1)
+        addresses = [f"0x{i:040x}" for i in range(500)]
+        first = addresses[0]
+        same_shard = [a for a in addresses[1:] if index(a) == index(first)][:2]
+        sharding.get_triad_id(first)
+        sharding.get_triad_id(same_shard[0])
+        # Touching the first address makes the second the eviction candidate
+        sharding.get_triad_id(first)
+        sharding.get_triad_id(same_shard[1])
+        self.assertIn(first, sharding.shard_mapping)
+        self.assertNotIn(same_shard[0], sharding.shard_mapping)
+
+    def test_batch_helpers_match_scalar(self):
+        sharding = TriadSharding(num_triads=7)
+        addresses = [f"0x{i:040x}" for i in range(200)]
+        expected = [sharding.get_triad_id(address) for address in addresses]
+        self.assertEqual(sharding.get_triad_ids(addresses).tolist(), expected)
+        self.assertEqual(sharding.get_triad_ids([a.encode() for a in addresses]).tolist(), expected)
+
+        distribution = sharding.get_shard_distribution_array(addresses)
+        self.assertEqual(len(distribution), 7)
+        self.assertEqual(distribution.tolist(), [expected.count(t) for t in range(7)])
+        self.assertEqual(sharding.get_shard_distribution(addresses),
+                         {t: expected.count(t) for t in set(expected)})
+
+        self.assertEqual(sharding.get_addresses_for_triad(addresses, 3),
+                         [a for a, t in zip(addresses, expected) if t == 3])
+
+    def test_get_addresses_for_triad_accepts_arrays(self):
+        sharding = TriadSharding(num_triads=7)
+        addresses = [f"0x{i:040x}" for i in range(50)]
+        self.assertEqual(sharding.get_addresses_for_triad(np.array([], dtype=str), 3), [])
+        self.assertEqual(list(sharding.get_addresses_for_triad(np.array(addresses), 3)),
+                         sharding.get_addresses_for_triad(addresses, 3))
+
+class TestFractalSharding(unittest.TestCase):
+
+    def test_coordinates_batch_matches_scalar(self):
+        sharding = FractalSharding(max_depth=4)
+        addresses = [f"0x{i:040x}" for i in range(200)]
+        coordinates = sharding.get_fractal_coordinates_batch(addresses)
+        self.assertEqual(coordinates.shape, (200, 4))
+        self.assertEqual(coordinates.dtype, np.uint8)
+        self.assertEqual([tuple(row) for row in coordinates.tolist()],
+                         [sharding.get_fractal_coordinates(address) for address in addresses])
+        self.assertEqual(sharding.get_fractal_coordinates_batch([]).shape, (0, 4))
 
 if __name__ == '__main__':
     unittest.main()
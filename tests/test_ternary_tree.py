@@ -0,0 +1,44 @@
+import unittest
+from ternary_tree import TernaryForest, TernaryNode
+
+class TestTernaryForest(unittest.TestCase):
+
+    def test_growth_keeps_payloads_and_children(self):
+        forest = TernaryForest(capacity=1)
+        root = forest.add_node("node 0")
+        expected_children = {root: [-1, -1, -1]}
+        # Breadth-first complete ternary tree, forcing several regrowths
+        for index in range(1, 40):
+            parent, position = (index - 1) // 3, (index - 1) % 3
+            self.assertEqual(forest.add_node(f"node {index}", parent, position), index)
+            expected_children[index] = [-1, -1, -1]
+            expected_children[parent][position] = index
+
+        self.assertEqual(forest.size, 40)
+        self.assertGreaterEqual(len(forest.data), 40)
+        for index in range(40):
+            self.assertEqual(forest.data[index], f"node {index}")
+            self.assertEqual(forest.children[index].tolist(), expected_children[index])
+
+    def test_from_node(self):
+        root = TernaryNode("root")
+        root.left = TernaryNode("left")
+        root.right = TernaryNode("right")
+        root.right.middle = TernaryNode("right middle")
+
+        forest = TernaryForest.from_node(root)
+
+        self.assertEqual(forest.size, 4)
+        self.assertEqual(forest.data[0], "root")
+        left, middle, right = forest.children[0].tolist()
+        self.assertEqual(forest.data[left], "left")
+        self.assertEqual(middle, -1)
+        self.assertEqual(forest.data[right], "right")
+        self.assertEqual(forest.data[forest.children[right, 1]], "right middle")
+
+    def test_rejects_empty_capacity(self):
+        with self.assertRaises(ValueError):
+            TernaryForest(capacity=0)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,75 @@
+import importlib.util
+import os
+import unittest
+
+# Loaded by path: the seirchain.svm package __init__ imports an
+# execution.parallel module that is not in the tree
+_spec = importlib.util.spec_from_file_location(
+    "transactional_memory",
+    os.path.join(os.path.dirname(__file__), "..", "src", "seirchain", "svm",
+                 "execution", "transactional_memory.py"))
+transactional_memory = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(transactional_memory)
+TransactionalMemory = transactional_memory.TransactionalMemory
+TransactionState = transactional_memory.TransactionState
+
+class TestTransactionalMemory(unittest.TestCase):
+
+    def setUp(self):
+        self.memory = TransactionalMemory()
+
+    def test_commit_applies_writes(self):
+        self.memory.begin_transaction("t1", triad_id=1)
+        self.memory.write("t1", "balance", 100)
+        self.assertTrue(self.memory.validate_transaction("t1"))
+        self.assertTrue(self.memory.commit_transaction("t1"))
+        self.assertEqual(self.memory.global_state["balance"], "modified_by_t1")
+        self.assertEqual(self.memory.get_transaction_state("t1"), TransactionState.COMMITTED)
+
+    def test_stale_read_conflicts(self):
+        self.memory.begin_transaction("t1", triad_id=1)
+        self.memory.begin_transaction("t2", triad_id=1)
+        self.memory.write("t1", "balance", 100)
+        self.assertIsNone(self.memory.read("t2", "balance"))
+        self.assertTrue(self.memory.validate_transaction("t1"))
+        self.assertTrue(self.memory.commit_transaction("t1"))
+        self.assertFalse(self.memory.validate_transaction("t2"))
+
+    def test_begin_during_commit_sees_consistent_snapshot(self):
+        memory = self.memory
+        memory.begin_transaction("t1", triad_id=1)
+        memory.write("t1", "balance", 100)
+        self.assertTrue(memory.validate_transaction("t1"))
+
+        # Start t2 while t1's commit is taking its stripe locks
+        acquire_stripes = memory._acquire_stripes
+        observed = {}
+
+        def acquire_and_begin(indices):
+            acquire_stripes(indices)
+            if not observed:
+                # read() would block on the stripe this thread holds, so
+                # record the read the way read() does
+                memory.begin_transaction("t2", triad_id=1)
+                observed["read"] = memory.global_state.get("balance")
+                memory.transactions["t2"].read_set.add("balance")
+
+        memory._acquire_stripes = acquire_and_begin
+        self.assertTrue(memory.commit_transaction("t1"))
+        memory._acquire_stripes = acquire_stripes
+
+        # t2 saw the old value, so it must not validate
+        self.assertIsNone(observed["read"])
+        self.assertFalse(memory.validate_transaction("t2"))
+
+    def test_no_reads_after_validation_starts(self):
+        self.memory.begin_transaction("t1", triad_id=1)
+        self.memory.read("t1", "balance")
+        self.assertTrue(self.memory.validate_transaction("t1"))
+        with self.assertRaises(ValueError):
+            self.memory.read("t1", "other")
+        self.assertFalse(self.memory.write("t1", "other", 1))
+        self.assertEqual(self.memory.transactions["t1"].read_set, {"balance"})
+
+if __name__ == '__main__':
+    unittest.main()
@@ -26,5 +26,18 @@ class TestTwoPhaseCommit(unittest.TestCase):
         self.assertFalse(participants[1].committed)
         self.assertTrue(participants[1].aborted)
 
+    def test_unexpected_prepare_error_aborts_and_raises(self):
+        class BrokenParticipant(Participant):
+            def prepare(self):
+                raise RuntimeError("disk full")
+
+        participants = [Participant("p1"), BrokenParticipant("p2")]
+        coordinator = Coordinator(participants)
+        with self.assertRaises(RuntimeError):
+            coordinator.execute_transaction()
+        for p in participants:
+            self.assertFalse(p.committed)
+            self.assertTrue(p.aborted)
+
 if __name__ == '__main__':
     unittest.main()